@@ -103,18 +103,14 @@ class Application:
                 logger.info("Immediate synchronization completed")
                 return 0
             else:
-                # Start scheduled operation
+                # Consume continuously until a shutdown signal stops it
                 logger.info(
-                    "Starting scheduled operation",
-                    schedule_time=config.scheduler.schedule_time,
+                    "Starting continuous operation",
+                    report_time=config.scheduler.schedule_time,
                     timezone=config.scheduler.timezone
                 )
                 scheduler.start()
-                
-                # Keep running until shutdown signal
-                while self.running:
-                    signal.pause()
-                
+
                 logger.info("Shutting down scheduler")
                 scheduler.stop()
                 return 0
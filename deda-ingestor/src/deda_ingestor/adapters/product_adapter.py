@@ -1,20 +1,52 @@
 """Adapter for transforming product data between different formats."""
-from datetime import datetime
-from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, Optional
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional, Tuple, Union
 from uuid import uuid4
 
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from ..core.exceptions import AdapterError
 from ..core.models import (
     Product,
     ProductElement,
+    ProductMessage,
     IvantiProduct,
     IvantiProductElement
 )
+from ..utils.timestamps import parse_timestamp
 from .base import BaseAdapter
 
+# Ivanti element key -> (ProductElement alias, default if missing)
+_IVANTI_ELEMENT_FIELDS: Dict[str, Tuple[str, Any]] = {
+    "length": ("Lenght", 0),
+    "name": ("Procuct Element", ""),
+    "type": ("Type", ""),
+    "startup_days": ("GG Startup", 0),
+    "resource_unit": ("RU", ""),
+    "resource_unit_qty": ("RU Qty", 0),
+    "resource_unit_measure": ("RU Unit of measure", ""),
+    "quantity_min": ("Q.ty min", 0),
+    "quantity_max": ("Q.ty MAX", 0),
+    "max_discount_percentage": ("%Sconto MAX", 0),
+    "startup_cost": ("Startup Costo", 0),
+    "startup_margin": ("Startup Margine", 0),
+    "startup_price": ("Startup Prezzo", 0),
+    "monthly_fee_cost": ("Canone Costo Mese", 0),
+    "monthly_fee_margin": ("Canone Margine", 0),
+    "monthly_fee_price": ("Canone Prezzo Mese", 0),
+    "extended_description": ("Extended Description", ""),
+    "profit_center": ("Profit Center Prevalente", ""),
+    "status": ("Status", "Active"),
+    "notes": ("Note", None),
+    "object_reference": ("Object", None),
+}
+
+# Built once; validates product messages, raw bytes or decoded dicts,
+# entirely in pydantic-core
+_PRODUCT_MESSAGE_ADAPTER = TypeAdapter(ProductMessage)
+
 
 class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
     """Adapter for transforming product data between RabbitMQ and domain models."""
@@ -43,12 +75,16 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
     ]
 
     @classmethod
-    def from_rabbitmq_message(cls, message: Dict[str, Any]) -> Product:
+    def from_rabbitmq_message(
+        cls,
+        message: Union[Dict[str, Any], bytes]
+    ) -> Product:
         """
         Convert a RabbitMQ message to a Product domain model.
 
         Args:
-            message: Raw data from RabbitMQ
+            message: Raw data from RabbitMQ, either decoded or as the JSON
+                message body
 
         Returns:
             Product: Domain model instance
@@ -56,9 +92,50 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
         Raises:
             AdapterError: If conversion fails
         """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            try:
+                message = orjson.loads(message)
+            except orjson.JSONDecodeError as e:
+                raise AdapterError(
+                    "Invalid JSON in product message",
+                    details={"error": str(e)}
+                ) from e
+
         adapter = cls()
         return adapter.adapt(message)
 
+    @classmethod
+    def from_rabbitmq_body(cls, body: bytes) -> Product:
+        """
+        Convert a raw RabbitMQ message body to a Product domain model.
+
+        The JSON is parsed and validated in a single pass, without building
+        an intermediate dict. The validated message then goes through the
+        same required-field checks as from_rabbitmq_message().
+
+        Args:
+            body: Raw JSON message body from RabbitMQ
+
+        Returns:
+            Product: Domain model instance
+
+        Raises:
+            AdapterError: If the body is not a valid product message
+        """
+        try:
+            message = _PRODUCT_MESSAGE_ADAPTER.validate_json(body)
+        except ValidationError as e:
+            raise AdapterError(
+                "Invalid product message",
+                details={"validation_errors": e.errors(include_url=False)}
+            ) from e
+
+        adapter = cls()
+        adapter.validate_input(message.model_dump(by_alias=True))
+        product = cls._product_from_message(message)
+        adapter.validate_output(product)
+        return product
+
     def validate_input(self, data: Dict[str, Any]) -> None:
         """
         Validate input data from RabbitMQ.
@@ -115,37 +192,32 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
             AdapterError: If transformation fails
         """
         try:
-            # Transform product elements
-            product_elements = []
-            for i, element_data in enumerate(data.get("productElements", [])):
-                try:
-                    element = self._transform_product_element(element_data)
-                    product_elements.append(element)
-                except Exception as e:
-                    raise AdapterError(
-                        f"Failed to transform product element at index {i}",
-                        details={
-                            "element_index": i,
-                            "element_data": element_data,
-                            "error": str(e)
-                        }
-                    ) from e
+            message = _PRODUCT_MESSAGE_ADAPTER.validate_python(data)
+        except ValidationError as e:
+            raise AdapterError(
+                "Failed to transform product data",
+                details={"validation_errors": e.errors(include_url=False)}
+            ) from e
 
-            # Create product instance
-            return Product(
-                product_id=str(data["productId"]),
-                product_name=str(data["productName"]),
-                product_elements=product_elements,
-                created_at=datetime.utcnow()
-            )
+        return self._product_from_message(message)
 
-        except Exception as e:
-            if not isinstance(e, AdapterError):
-                raise AdapterError(
-                    "Failed to transform product data",
-                    details={"error": str(e)}
-                ) from e
-            raise
+    @staticmethod
+    def _product_from_message(message: ProductMessage) -> Product:
+        """
+        Build a Product domain model from a validated product message.
+
+        Args:
+            message: Validated product message
+
+        Returns:
+            Product: Domain model instance
+        """
+        return Product(
+            product_id=message.product_id,
+            product_name=message.product_name,
+            product_elements=message.product_elements,
+            created_at=datetime.now(UTC)
+        )
 
     def validate_output(self, data: Product) -> None:
         """
@@ -163,54 +235,6 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
                 details={"product_id": data.product_id}
             )
 
-    def _transform_product_element(self, data: Dict[str, Any]) -> ProductElement:
-        """
-        Transform raw element data to ProductElement.
-
-        Args:
-            data: Raw element data
-
-        Returns:
-            ProductElement: Transformed element
-
-        Raises:
-            AdapterError: If transformation fails
-        """
-        try:
-            # Convert numeric values to Decimal
-            numeric_fields = {
-                "%Sconto MAX": "max_discount_percentage",
-                "Startup Costo": "startup_cost",
-                "Startup Margine": "startup_margin",
-                "Startup Prezzo": "startup_price",
-                "Canone Costo Mese": "monthly_fee_cost",
-                "Canone Margine": "monthly_fee_margin",
-                "Canone Prezzo Mese": "monthly_fee_price"
-            }
-
-            for source_field, _ in numeric_fields.items():
-                try:
-                    data[source_field] = Decimal(str(data.get(source_field, 0)))
-                except (InvalidOperation, TypeError) as e:
-                    raise AdapterError(
-                        f"Invalid numeric value for {source_field}",
-                        details={
-                            "field": source_field,
-                            "value": data.get(source_field),
-                            "error": str(e)
-                        }
-                    ) from e
-
-            return ProductElement(**data)
-
-        except Exception as e:
-            if not isinstance(e, AdapterError):
-                raise AdapterError(
-                    "Failed to transform product element",
-                    details={"error": str(e)}
-                ) from e
-            raise
-
     @staticmethod
     def to_ivanti_product(product: Product) -> IvantiProduct:
         """
@@ -327,13 +351,9 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
             created_at = None
             updated_at = None
             if created_str := response_data.get("created_at"):
-                created_at = datetime.fromisoformat(
-                    created_str.replace("Z", "+00:00")
-                )
+                created_at = parse_timestamp(created_str)
             if updated_str := response_data.get("updated_at"):
-                updated_at = datetime.fromisoformat(
-                    updated_str.replace("Z", "+00:00")
-                )
+                updated_at = parse_timestamp(updated_str)
 
             # Convert elements
             product_elements = []
@@ -359,7 +379,7 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
                 product_id=product_id,
                 product_name=product_name,
                 product_elements=product_elements,
-                created_at=created_at or datetime.utcnow(),
+                created_at=created_at or datetime.now(UTC),
                 updated_at=updated_at
             )
 
@@ -374,6 +394,9 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
         """
         Transform Ivanti element data to format expected by ProductElement.
 
+        Numeric strings and floats are left for ProductElement to coerce to
+        Decimal.
+
         Args:
             data: Raw Ivanti element data
 
@@ -385,30 +408,11 @@ class ProductAdapter(BaseAdapter[Dict[str, Any], Product]):
         """
         try:
             return {
-                "Lenght": data.get("length", 0),
-                "Procuct Element": data.get("name", ""),
-                "Type": data.get("type", ""),
-                "GG Startup": data.get("startup_days", 0),
-                "RU": data.get("resource_unit", ""),
-                "RU Qty": data.get("resource_unit_qty", 0),
-                "RU Unit of measure": data.get("resource_unit_measure", ""),
-                "Q.ty min": data.get("quantity_min", 0),
-                "Q.ty MAX": data.get("quantity_max", 0),
-                "%Sconto MAX": Decimal(str(data.get("max_discount_percentage", 0))),
-                "Startup Costo": Decimal(str(data.get("startup_cost", 0))),
-                "Startup Margine": Decimal(str(data.get("startup_margin", 0))),
-                "Startup Prezzo": Decimal(str(data.get("startup_price", 0))),
-                "Canone Costo Mese": Decimal(str(data.get("monthly_fee_cost", 0))),
-                "Canone Margine": Decimal(str(data.get("monthly_fee_margin", 0))),
-                "Canone Prezzo Mese": Decimal(str(data.get("monthly_fee_price", 0))),
-                "Extended Description": data.get("extended_description", ""),
-                "Profit Center Prevalente": data.get("profit_center", ""),
-                "Status": data.get("status", "Active"),
-                "Note": data.get("notes"),
-                "Object": data.get("object_reference")
+                alias: data.get(key, default)
+                for key, (alias, default) in _IVANTI_ELEMENT_FIELDS.items()
             }
         except Exception as e:
             raise AdapterError(
                 "Failed to transform Ivanti element data",
                 details={"error": str(e)}
-            ) from e
\ No newline at end of file
+            ) from e
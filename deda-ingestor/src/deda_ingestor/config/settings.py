@@ -20,6 +20,11 @@ class RabbitMQConfig:
     queue: str = os.getenv("RABBITMQ_QUEUE", "products_queue")
     connection_retry_count: int = int(os.getenv("RABBITMQ_RETRY_COUNT", "3"))
     connection_retry_delay: int = int(os.getenv("RABBITMQ_RETRY_DELAY", "5"))
+    ack_batch_size: int = int(os.getenv("RABBITMQ_ACK_BATCH_SIZE", "64"))
+    ack_flush_interval: float = float(os.getenv("RABBITMQ_ACK_FLUSH_INTERVAL", "1.0"))
+    prefetch_count: int = int(os.getenv("RABBITMQ_PREFETCH_COUNT", "100"))
+    batch_size: int = int(os.getenv("RABBITMQ_BATCH_SIZE", "100"))
+    batch_max_wait: float = float(os.getenv("RABBITMQ_BATCH_MAX_WAIT", "1.0"))
 
 
 @dataclass
@@ -33,6 +38,19 @@ class IvantiConfig:
     request_timeout: int = int(os.getenv("IVANTI_REQUEST_TIMEOUT", "30"))
     max_retries: int = int(os.getenv("IVANTI_MAX_RETRIES", "3"))
     retry_delay: int = int(os.getenv("IVANTI_RETRY_DELAY", "5"))
+    max_concurrent_requests: int = int(
+        os.getenv("IVANTI_MAX_CONCURRENT_REQUESTS", "8")
+    )
+    etag_cache_size: int = int(os.getenv("IVANTI_ETAG_CACHE_SIZE", "10000"))
+    # "application/json" or "application/msgpack" (needs the msgpack extra)
+    content_type: str = os.getenv("IVANTI_CONTENT_TYPE", "application/json")
+    # Directory caching access tokens across runs; disabled when empty
+    token_cache_dir: str = os.getenv("IVANTI_TOKEN_CACHE_DIR", "")
+    # Send product batches to the products:batch endpoint instead of one
+    # request per product; only for APIs that provide it
+    use_batch_endpoint: bool = (
+        os.getenv("IVANTI_USE_BATCH_ENDPOINT", "false").lower() == "true"
+    )
 
 
 @dataclass
@@ -65,10 +83,9 @@ class AppConfig:
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
 
     def __post_init__(self):
-        """Validate configuration and create necessary directories."""
+        """Validate configuration."""
         if self.environment != "test":
             self._validate_config()
-        self._create_directories()
 
     def _validate_config(self) -> None:
         """Validate required configuration values."""
@@ -79,11 +96,6 @@ class AppConfig:
         if not self.ivanti.client_id or not self.ivanti.client_secret:
             raise ValueError("IVANTI_CLIENT_ID and IVANTI_CLIENT_SECRET must be set")
 
-    def _create_directories(self) -> None:
-        """Create necessary directories if they don't exist."""
-        if self.environment != "test":
-            self.log.directory.mkdir(parents=True, exist_ok=True)
-
 
 # Set test environment for pytest
 if "PYTEST_CURRENT_TEST" in os.environ:
@@ -57,6 +57,11 @@ class Container(containers.DeclarativeContainer):
         queue=config.provided.rabbitmq.queue,
         connection_retry_count=config.provided.rabbitmq.connection_retry_count,
         connection_retry_delay=config.provided.rabbitmq.connection_retry_delay,
+        ack_batch_size=config.provided.rabbitmq.ack_batch_size,
+        ack_flush_interval=config.provided.rabbitmq.ack_flush_interval,
+        prefetch_count=config.provided.rabbitmq.prefetch_count,
+        batch_size=config.provided.rabbitmq.batch_size,
+        batch_max_wait=config.provided.rabbitmq.batch_max_wait,
     )
 
     rabbitmq_repository = providers.Singleton(
@@ -76,6 +81,11 @@ class Container(containers.DeclarativeContainer):
         request_timeout=config.provided.ivanti.request_timeout,
         max_retries=config.provided.ivanti.max_retries,
         retry_delay=config.provided.ivanti.retry_delay,
+        max_concurrent_requests=config.provided.ivanti.max_concurrent_requests,
+        etag_cache_size=config.provided.ivanti.etag_cache_size,
+        content_type=config.provided.ivanti.content_type,
+        token_cache_dir=config.provided.ivanti.token_cache_dir,
+        use_batch_endpoint=config.provided.ivanti.use_batch_endpoint,
     )
 
     ivanti_repository = providers.Singleton(
@@ -96,7 +106,10 @@ class Container(containers.DeclarativeContainer):
         ProductService,
         message_queue=rabbitmq_repository,
         product_repository=ivanti_repository,
-        retry_config=retry_config
+        retry_config=retry_config,
+        batch_size=rabbitmq_config.provided.batch_size,
+        batch_max_wait=rabbitmq_config.provided.batch_max_wait,
+        max_workers=ivanti_config.provided.max_concurrent_requests
     )
 
     # Lifecycle hooks
@@ -3,7 +3,9 @@ from datetime import datetime, UTC
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..utils.timestamps import parse_timestamp
 
 
 class ProductElement(BaseModel):
@@ -133,14 +135,10 @@ class Product(BaseModel):
             }
             elements.append(ProductElement(**element))
 
-        created_at = datetime.fromisoformat(
-            data["created_at"].replace("Z", "+00:00")
-        )
+        created_at = parse_timestamp(data["created_at"])
         updated_at = None
         if data.get("updated_at"):
-            updated_at = datetime.fromisoformat(
-                data["updated_at"].replace("Z", "+00:00")
-            )
+            updated_at = parse_timestamp(data["updated_at"])
 
         return cls(
             product_id=data["id"],
@@ -151,6 +149,15 @@ class Product(BaseModel):
         )
 
 
+class ProductMessage(BaseModel):
+    """Product message as published on RabbitMQ."""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    product_id: str = Field(alias="productId")
+    product_name: str = Field(alias="productName")
+    product_elements: List[ProductElement] = Field(alias="productElements")
+
+
 class IvantiProductElement(BaseModel):
     """Ivanti product element model."""
     id: str
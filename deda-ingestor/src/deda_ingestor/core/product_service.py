@@ -1,5 +1,7 @@
 """Core service for handling product synchronization."""
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..adapters.product_adapter import ProductAdapter
 from ..core.exceptions import (
@@ -23,7 +25,10 @@ class ProductService:
         self,
         message_queue: MessageQueueRepository,
         product_repository: ProductRepository,
-        retry_config: Optional[RetryConfig] = None
+        retry_config: Optional[RetryConfig] = None,
+        batch_size: int = 100,
+        batch_max_wait: float = 1.0,
+        max_workers: int = 8
     ):
         """
         Initialize ProductService.
@@ -32,11 +37,20 @@ class ProductService:
             message_queue: Repository for message queue operations
             product_repository: Repository for product operations
             retry_config: Retry configuration
+            batch_size: Maximum number of messages processed per batch
+            batch_max_wait: Maximum seconds to wait for a batch to fill up
+            max_workers: Number of messages processed concurrently
         """
         self.message_queue = message_queue
         self.product_repository = product_repository
         self.retry_config = retry_config or RetryConfig()
+        self.batch_size = batch_size
+        self.batch_max_wait = batch_max_wait
+        self.max_workers = max_workers
         self.sync_result = SyncResult()
+        # Guards sync_result, which is updated from worker threads
+        self._result_lock = threading.Lock()
+        self._stop_event = threading.Event()
 
     def _validate_repositories(self) -> None:
         """
@@ -50,6 +64,20 @@ class ProductService:
         if not self.product_repository.health_check():
             raise ConnectionError("Product repository is not healthy")
 
+    def health_check(self) -> bool:
+        """
+        Check health of the underlying repositories.
+
+        Returns:
+            bool: True if all repositories are healthy
+        """
+        try:
+            self._validate_repositories()
+            return True
+        except ConnectionError as e:
+            logger.error("Health check failed", error=str(e))
+            return False
+
     @retry_with_backoff(
         retryable_exceptions=RetryableError,
         config=RetryConfig(max_attempts=3)
@@ -82,73 +110,171 @@ class ProductService:
 
         return self.sync_result
 
-    def _process_message_batch(self) -> None:
+    def run_forever(self) -> None:
         """
-        Process a batch of messages from the queue.
+        Continuously consume and sync messages until stop() is called.
+
+        Unlike process_messages, idle periods do not end the run, so
+        messages are synced as soon as they arrive. Retryable failures are
+        logged and consumption resumes after a backoff delay.
+
+        Raises:
+            ConnectionError: If connection to services fails permanently
+        """
+        logger.info("Starting continuous product synchronization")
+        self._stop_event.clear()
+        self._validate_repositories()
+
+        while not self._stop_event.is_set():
+            try:
+                self._process_message_batch(stop_when_idle=False)
+            except MessageProcessingError as e:
+                if not isinstance(e.__cause__, RetryableError):
+                    raise
+                logger.warning(
+                    "Consumption interrupted, resuming",
+                    error=str(e),
+                    retry_in=f"{self.retry_config.base_delay:.2f}s"
+                )
+                self._stop_event.wait(self.retry_config.base_delay)
+
+        logger.info("Continuous product synchronization stopped")
+
+    def stop(self) -> None:
+        """Ask a running run_forever() loop to stop after the current batch."""
+        self._stop_event.set()
+
+    def report(self) -> SyncResult:
+        """
+        Log and reset the results accumulated since the last report.
+
+        Returns:
+            SyncResult: Results of the reporting period
+        """
+        with self._result_lock:
+            period_result = self.sync_result
+            self.sync_result = SyncResult()
+
+        period_result.complete()
+        self._log_sync_results(period_result)
+        return period_result
+
+    def _process_message_batch(self, stop_when_idle: bool = True) -> None:
+        """
+        Process messages from the queue in batches.
+
+        Args:
+            stop_when_idle: Return once the queue is drained instead of
+                waiting for further messages until stop() is called
 
         Raises:
             ConnectionError: If connection fails
             MessageProcessingError: If processing fails
         """
+        batches = self.message_queue.consume_batches(
+            self.batch_size,
+            self.batch_max_wait
+        )
         try:
-            for message, delivery_tag in self.message_queue.consume_messages():
-                try:
-                    success = self._process_single_message(message)
-                    if success:
-                        self._acknowledge_message(delivery_tag)
-                    else:
-                        self._reject_message(delivery_tag)
-
-                except Exception as e:
-                    logger.exception(
-                        "Error processing message",
-                        error=str(e),
-                        delivery_tag=delivery_tag
-                    )
-                    self._reject_message(delivery_tag)
-                    self._record_processing_error(str(delivery_tag), e)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for batch in batches:
+                    if batch:
+                        self._process_batch(batch, executor)
+                    elif stop_when_idle:
+                        # Queue stayed idle for batch_max_wait seconds
+                        break
+                    if self._stop_event.is_set():
+                        break
 
         except Exception as e:
             raise MessageProcessingError(
                 f"Error during batch processing: {str(e)}"
             ) from e
+        finally:
+            batches.close()
 
-    def _process_single_message(self, message: dict) -> bool:
+    def _process_batch(
+        self,
+        batch: List[Tuple[Any, int]],
+        executor: ThreadPoolExecutor
+    ) -> None:
         """
-        Process a single message from the queue.
+        Process a batch of messages concurrently.
+
+        Messages are converted on the executor, then grouped by product:
+        each product's messages are processed serially, in delivery order,
+        so two messages for one product never race each other. Messages are
+        acknowledged or rejected on the calling thread in delivery order,
+        since the message queue channel is not thread-safe.
 
         Args:
-            message: Message to process
+            batch: Batch of (raw message body, delivery tag) tuples
+            executor: Executor running the product operations
+        """
+        conversions = [
+            executor.submit(self._convert_message_to_product, message)
+            for message, _ in batch
+        ]
+
+        outcomes: List[Future] = []
+        groups: Dict[str, List[Tuple[Product, Future]]] = {}
+        for conversion in conversions:
+            if conversion.exception() is not None:
+                outcomes.append(conversion)
+                continue
+
+            outcome: Future = Future()
+            product = conversion.result()
+            if product:
+                groups.setdefault(product.product_id, []).append(
+                    (product, outcome)
+                )
+            else:
+                outcome.set_result(False)
+            outcomes.append(outcome)
 
-        Returns:
-            bool: True if processing was successful
+        for group in groups.values():
+            executor.submit(self._process_products_in_order, group)
 
-        Raises:
-            AdapterError: If message conversion fails
-            MessageProcessingError: If processing fails
-        """
-        try:
-            # Convert message to domain model
-            product = self._convert_message_to_product(message)
-            if not product:
-                return False
+        for (_, delivery_tag), outcome in zip(batch, outcomes):
+            try:
+                if outcome.result():
+                    self._acknowledge_message(delivery_tag)
+                else:
+                    self._reject_message(delivery_tag)
 
-            # Process the product
-            return self._process_product(product)
+            except Exception as e:
+                logger.exception(
+                    "Error processing message",
+                    error=str(e),
+                    delivery_tag=delivery_tag
+                )
+                self._reject_message(delivery_tag)
+                self._record_processing_error(str(delivery_tag), e)
 
-        except Exception as e:
-            if not isinstance(e, (AdapterError, MessageProcessingError)):
-                raise MessageProcessingError(
-                    f"Unexpected error processing message: {str(e)}"
-                ) from e
-            raise
+    def _process_products_in_order(
+        self,
+        group: List[Tuple[Product, Future]]
+    ) -> None:
+        """
+        Process the messages of one product serially.
+
+        Args:
+            group: (product, outcome) pairs in delivery order; each outcome
+                receives the processing result or error of its product
+        """
+        for product, outcome in group:
+            try:
+                outcome.set_result(self._process_product(product))
+            except Exception as e:
+                outcome.set_exception(e)
 
-    def _convert_message_to_product(self, message: dict) -> Optional[Product]:
+    def _convert_message_to_product(self, message: bytes) -> Optional[Product]:
         """
-        Convert message to Product domain model.
+        Convert a raw message body to Product domain model.
 
         Args:
-            message: Message to convert
+            message: Raw message body to convert
 
         Returns:
             Optional[Product]: Converted product or None if conversion fails
@@ -157,13 +283,16 @@ class ProductService:
             AdapterError: If conversion fails
         """
         try:
-            return ProductAdapter.from_rabbitmq_message(message)
+            return ProductAdapter.from_rabbitmq_body(message)
         except Exception as e:
-            logger.error(
+            # The body is only decoded if a sink actually emits the record
+            logger.opt(lazy=True).error(
                 "Failed to convert message to product",
-                error=str(e),
-                message=message
+                error=lambda: str(e),
+                message=lambda: message.decode('utf-8', errors='replace')
             )
+            if isinstance(e, AdapterError):
+                raise
             raise AdapterError(
                 f"Failed to convert message to product: {str(e)}",
                 details={"message": message}
@@ -217,7 +346,7 @@ class ProductService:
                     "Product created successfully",
                     product_id=product.product_id
                 )
-                self.sync_result.record_success()
+                self._record_success()
                 return True
             else:
                 logger.error(
@@ -258,7 +387,7 @@ class ProductService:
                     "Product updated successfully",
                     product_id=product.product_id
                 )
-                self.sync_result.record_success()
+                self._record_success()
                 return True
             else:
                 logger.error(
@@ -315,6 +444,11 @@ class ProductService:
                 delivery_tag=delivery_tag
             )
 
+    def _record_success(self) -> None:
+        """Record a successful sync in the sync result."""
+        with self._result_lock:
+            self.sync_result.record_success()
+
     def _record_processing_error(
         self,
         identifier: str,
@@ -327,25 +461,32 @@ class ProductService:
             identifier: Error identifier (product ID or delivery tag)
             error: Error details
         """
-        self.sync_result.record_failure(
-            identifier,
-            str(error) if isinstance(error, Exception) else error
-        )
+        with self._result_lock:
+            self.sync_result.record_failure(
+                identifier,
+                str(error) if isinstance(error, Exception) else error
+            )
+
+    def _log_sync_results(self, sync_result: Optional[SyncResult] = None) -> None:
+        """
+        Log the synchronization results.
 
-    def _log_sync_results(self) -> None:
-        """Log the synchronization results."""
+        Args:
+            sync_result: Results to log, defaults to the current results
+        """
+        sync_result = sync_result or self.sync_result
         logger.info(
             "Product synchronization completed",
-            total_processed=self.sync_result.total_processed,
-            successful=self.sync_result.successful_syncs,
-            failed=self.sync_result.failed_syncs,
-            skipped=self.sync_result.skipped_syncs,
-            duration_seconds=self.sync_result.duration_seconds,
-            success_rate=f"{self.sync_result.success_rate:.2f}%"
+            total_processed=sync_result.total_processed,
+            successful=sync_result.successful_syncs,
+            failed=sync_result.failed_syncs,
+            skipped=sync_result.skipped_syncs,
+            duration_seconds=sync_result.duration_seconds,
+            success_rate=f"{sync_result.success_rate:.2f}%"
         )
 
-        if self.sync_result.errors:
+        if sync_result.errors:
             logger.error(
                 "Synchronization errors occurred",
-                errors=self.sync_result.errors
-            )
\ No newline at end of file
+                errors=sync_result.errors
+            )
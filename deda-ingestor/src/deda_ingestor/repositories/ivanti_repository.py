@@ -1,26 +1,71 @@
 """Repository for interacting with Ivanti API."""
+import socket
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, UTC
-from typing import Dict, List, Optional, Union
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
+import orjson
 from loguru import logger
 
+try:
+    from msgspec import msgpack
+except ImportError:  # Optional "msgpack" extra
+    msgpack = None
+
 from ..config.settings import IvantiConfig
 from ..core.exceptions import (
     AuthenticationError,
+    ConfigurationError,
     IvantiAPIError,
     RetryableAPIError,
     RetryableConnectionError
 )
 from ..core.models import Product, SyncResult
 from ..utils.retry import RetryConfig, retry_with_backoff
+from ..utils.token_cache import (
+    delete_token,
+    load_token,
+    save_token,
+    token_cache_key
+)
 from .base import BaseRepository
 
+_PRODUCTS_PATH = "/products"
+_PRODUCT_PATH = _PRODUCTS_PATH + "/{}"
+_BATCH_PATH = _PRODUCTS_PATH + ":batch"
+
+# Status codes meaning the API has no batch endpoint
+_BATCH_UNSUPPORTED_CODES = (404, 405, 501)
+
+_JSON_CONTENT_TYPE = "application/json"
+_MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Small request/response pairs shouldn't wait on Nagle's algorithm, and
+# idle pooled connections should be probed rather than silently dropped
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Shared by every API call; backoff delays are jittered so concurrent
+# failures do not retry in lockstep against the API
+_api_retry = retry_with_backoff(
+    retryable_exceptions=(RetryableConnectionError, RetryableAPIError),
+    config=RetryConfig(max_attempts=3)
+)
+
 
 class IvantiRepository(BaseRepository):
     """Repository for Ivanti API operations."""
 
+    # Access tokens shared by every repository in the process, keyed by a
+    # hash of the client credentials: token_cache_key -> (token, expiry)
+    _token_cache: Dict[str, Tuple[str, float]] = {}
+
     def __init__(self, config: IvantiConfig):
         """
         Initialize repository.
@@ -29,24 +74,79 @@ class IvantiRepository(BaseRepository):
             config: Ivanti configuration
         """
         self.config = config
+        self._encode_payload = self._get_payload_encoder(config.content_type)
+        self._payload_headers = {"Content-Type": config.content_type}
+        # Credentials never change, so the token request body is encoded once
+        self._auth_body = orjson.dumps({
+            "client_id": config.client_id,
+            "client_secret": config.client_secret,
+            "grant_type": "client_credentials"
+        })
         self._access_token = None
         self._token_expiry = 0
+        self._auth_lock = threading.Lock()
+        # LRU of product_id -> (ETag, product) for conditional GETs
+        self._etag_cache: "OrderedDict[str, Tuple[str, Product]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # Cleared once the API turns out not to support batch requests
+        self._batch_supported = config.use_batch_endpoint
+        # Shared by the in-memory and on-disk token caches
+        self._token_cache_key = token_cache_key(
+            config.client_id,
+            config.client_secret,
+            config.token_url
+        )
+        # Optional on-disk cache, so short-lived runs can reuse a token
+        self._token_cache_dir = (
+            Path(config.token_cache_dir).expanduser()
+            if config.token_cache_dir else None
+        )
         self._client = httpx.Client(
             base_url=config.api_url,
             timeout=config.request_timeout,
-            headers=self._get_default_headers()
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "X-API-Key": config.api_key
+            },
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=60
+                ),
+                socket_options=_SOCKET_OPTIONS
+            )
         )
 
-    def _get_default_headers(self) -> Dict[str, str]:
-        """Get default headers for API requests."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "X-API-Key": self.config.api_key
-        }
-        if self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
-        return headers
+    @staticmethod
+    def _get_payload_encoder(content_type: str) -> Callable[[dict], bytes]:
+        """
+        Get the encoder for product payloads.
+
+        Args:
+            content_type: Configured payload content type
+
+        Returns:
+            Callable[[dict], bytes]: Payload encoder
+
+        Raises:
+            ConfigurationError: If the content type is unsupported
+        """
+        if content_type == _JSON_CONTENT_TYPE:
+            return orjson.dumps
+        if content_type == _MSGPACK_CONTENT_TYPE:
+            if msgpack is None:
+                raise ConfigurationError(
+                    "msgspec is required for msgpack payloads; "
+                    "install the 'msgpack' extra"
+                )
+            return msgpack.encode
+        raise ConfigurationError(
+            f"Unsupported Ivanti content type: {content_type}",
+            details={"supported": [_JSON_CONTENT_TYPE, _MSGPACK_CONTENT_TYPE]}
+        )
 
     def is_connected(self) -> bool:
         """Check if repository is connected and token is valid."""
@@ -63,12 +163,12 @@ class IvantiRepository(BaseRepository):
             AuthenticationError: If authentication fails
         """
         if not self.is_connected():
-            self._authenticate()
+            # Concurrent callers share a single authentication round-trip
+            with self._auth_lock:
+                if not self.is_connected():
+                    self._authenticate()
 
-    @retry_with_backoff(
-        retryable_exceptions=(RetryableConnectionError, RetryableAPIError),
-        config=RetryConfig(max_attempts=3)
-    )
+    @_api_retry
     def _authenticate(self) -> None:
         """
         Authenticate with Ivanti API using OAuth2.
@@ -78,29 +178,43 @@ class IvantiRepository(BaseRepository):
             RetryableConnectionError: If connection fails temporarily
             RetryableAPIError: If API returns retryable error
         """
+        cached = self._token_cache.get(self._token_cache_key)
+        if not (cached and cached[1] > time.time()) and self._token_cache_dir:
+            cached = load_token(self._token_cache_dir, self._token_cache_key)
+        if cached and cached[1] > time.time():
+            logger.debug("Reusing cached Ivanti access token")
+            self._set_token(*cached)
+            self._token_cache[self._token_cache_key] = cached
+            return
+
         try:
             logger.info("Authenticating with Ivanti API")
 
-            auth_data = {
-                "client_id": self.config.client_id,
-                "client_secret": self.config.client_secret,
-                "grant_type": "client_credentials"
-            }
-
+            # Sent with the client's default JSON Content-Type
             response = self._client.post(
                 self.config.token_url,
-                json=auth_data
+                content=self._auth_body
             )
 
             self._handle_response(response, "authentication")
 
             auth_response = response.json()
-            self._access_token = auth_response["access_token"]
             # Set token expiry with 5-minute buffer
-            self._token_expiry = time.time() + auth_response["expires_in"] - 300
-
-            # Update client headers with new token
-            self._client.headers.update(self._get_default_headers())
+            self._set_token(
+                auth_response["access_token"],
+                time.time() + auth_response["expires_in"] - 300
+            )
+            self._token_cache[self._token_cache_key] = (
+                self._access_token,
+                self._token_expiry
+            )
+            if self._token_cache_dir:
+                save_token(
+                    self._token_cache_dir,
+                    self._token_cache_key,
+                    self._access_token,
+                    self._token_expiry
+                )
 
             logger.info("Successfully authenticated with Ivanti API")
 
@@ -115,6 +229,58 @@ class IvantiRepository(BaseRepository):
                 f"Authentication failed: {str(e)}"
             ) from e
 
+    def _set_token(self, access_token: str, token_expiry: float) -> None:
+        """
+        Use the given access token for subsequent requests.
+
+        Args:
+            access_token: OAuth2 access token
+            token_expiry: Token expiry as a UNIX timestamp
+        """
+        self._access_token = access_token
+        self._token_expiry = token_expiry
+
+        # Only the Authorization header changes; the rest is set once
+        self._client.headers.update({"Authorization": f"Bearer {access_token}"})
+
+    def _invalidate_token(self) -> None:
+        """Drop the current access token from this instance and the caches."""
+        self._token_cache.pop(self._token_cache_key, None)
+        if self._token_cache_dir:
+            delete_token(self._token_cache_dir, self._token_cache_key)
+        self._access_token = None
+        self._token_expiry = 0
+
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send an authenticated API request.
+
+        A 401 response means the access token was revoked or expired early,
+        so the token is refreshed and the request resent once.
+
+        Args:
+            method: HTTP method name
+            path: Request path relative to the API base URL
+            **kwargs: Arguments passed to the HTTP client
+
+        Returns:
+            httpx.Response: API response
+
+        Raises:
+            AuthenticationError: If re-authentication fails
+        """
+        self.connect()
+        send = getattr(self._client, method)
+        response = send(path, **kwargs)
+
+        if response.status_code == 401:
+            logger.info("Access token rejected, re-authenticating")
+            self._invalidate_token()
+            self.connect()
+            response = send(path, **kwargs)
+
+        return response
+
     def _handle_response(
         self,
         response: httpx.Response,
@@ -159,10 +325,7 @@ class IvantiRepository(BaseRepository):
                 response_body=error_body
             ) from e
 
-    @retry_with_backoff(
-        retryable_exceptions=(RetryableConnectionError, RetryableAPIError),
-        config=RetryConfig(max_attempts=3)
-    )
+    @_api_retry
     def get_product(self, product_id: str) -> Optional[Product]:
         """
         Get product from Ivanti.
@@ -178,28 +341,79 @@ class IvantiRepository(BaseRepository):
             RetryableAPIError: If API returns retryable error
         """
         try:
-            self.connect()
+            cached = self._get_cached_product(product_id)
+            response = self._request(
+                "get",
+                _PRODUCT_PATH.format(product_id),
+                headers={"If-None-Match": cached[0]} if cached else None
+            )
 
-            response = self._client.get(f"/products/{product_id}")
+            if response.status_code == 304 and cached:
+                # Unchanged since it was cached; skip parsing the body
+                return cached[1]
 
             try:
                 self._handle_response(response, "get_product")
             except IvantiAPIError as e:
                 if e.status_code == 404:
+                    self._evict_cached_product(product_id)
                     return None
                 raise
 
-            return Product.from_ivanti_response(response.json())
+            product = Product.from_ivanti_response(response.json())
+            etag = response.headers.get("ETag")
+            if etag:
+                self._cache_product(product_id, etag, product)
+            return product
 
         except httpx.TransportError as e:
             raise RetryableConnectionError(
                 f"Connection error during get_product: {str(e)}"
             ) from e
 
-    @retry_with_backoff(
-        retryable_exceptions=(RetryableConnectionError, RetryableAPIError),
-        config=RetryConfig(max_attempts=3)
-    )
+    def _get_cached_product(self, product_id: str) -> Optional[Tuple[str, Product]]:
+        """
+        Get the cached ETag and product for a product ID.
+
+        Args:
+            product_id: Product ID
+
+        Returns:
+            Optional[Tuple[str, Product]]: ETag and product if cached
+        """
+        with self._etag_lock:
+            cached = self._etag_cache.get(product_id)
+            if cached:
+                self._etag_cache.move_to_end(product_id)
+            return cached
+
+    def _cache_product(self, product_id: str, etag: str, product: Product) -> None:
+        """
+        Cache a product with its ETag, evicting the least recently used.
+
+        Args:
+            product_id: Product ID
+            etag: ETag returned with the product
+            product: Parsed product
+        """
+        if self.config.etag_cache_size <= 0:
+            return
+        with self._etag_lock:
+            self._etag_cache[product_id] = (etag, product)
+            self._etag_cache.move_to_end(product_id)
+            while len(self._etag_cache) > self.config.etag_cache_size:
+                self._etag_cache.popitem(last=False)
+
+    def _evict_cached_product(self, product_id: str) -> None:
+        """
+        Drop a product from the ETag cache.
+
+        Args:
+            product_id: Product ID
+        """
+        with self._etag_lock:
+            self._etag_cache.pop(product_id, None)
+
     def create_product(self, product: Product) -> bool:
         """
         Create product in Ivanti.
@@ -214,26 +428,15 @@ class IvantiRepository(BaseRepository):
             IvantiAPIError: If API request fails
             RetryableAPIError: If API returns retryable error
         """
-        try:
-            self.connect()
-
-            response = self._client.post(
-                "/products",
-                json=product.to_ivanti_request()
-            )
-
-            self._handle_response(response, "create_product")
-            return True
-
-        except httpx.TransportError as e:
-            raise RetryableConnectionError(
-                f"Connection error during create_product: {str(e)}"
-            ) from e
+        # Any cached copy is stale once the product is written
+        self._evict_cached_product(product.product_id)
+        return self._send_product(
+            "post",
+            _PRODUCTS_PATH,
+            self._encode_payload(product.to_ivanti_request()),
+            "create_product"
+        )
 
-    @retry_with_backoff(
-        retryable_exceptions=(RetryableConnectionError, RetryableAPIError),
-        config=RetryConfig(max_attempts=3)
-    )
     def update_product(self, product: Product) -> bool:
         """
         Update product in Ivanti.
@@ -248,20 +451,57 @@ class IvantiRepository(BaseRepository):
             IvantiAPIError: If API request fails
             RetryableAPIError: If API returns retryable error
         """
-        try:
-            self.connect()
+        # Any cached copy is stale once the product is written
+        self._evict_cached_product(product.product_id)
+        return self._send_product(
+            "put",
+            _PRODUCT_PATH.format(product.product_id),
+            self._encode_payload(product.to_ivanti_request()),
+            "update_product"
+        )
+
+    @_api_retry
+    def _send_product(
+        self,
+        method: str,
+        path: str,
+        payload: bytes,
+        context: str
+    ) -> bool:
+        """
+        Send a serialized product payload to Ivanti.
 
-            response = self._client.put(
-                f"/products/{product.product_id}",
-                json=product.to_ivanti_request()
+        The payload is serialized once by the caller so that retries resend
+        the same bytes instead of rebuilding them on every attempt.
+
+        Args:
+            method: HTTP method ("post" or "put")
+            path: Request path relative to the API base URL
+            payload: Encoded product
+            context: Operation name used in errors
+
+        Returns:
+            bool: True if successful
+
+        Raises:
+            IvantiAPIError: If API request fails
+            RetryableAPIError: If API returns retryable error
+            RetryableConnectionError: If connection fails temporarily
+        """
+        try:
+            response = self._request(
+                method,
+                path,
+                content=payload,
+                headers=self._payload_headers
             )
 
-            self._handle_response(response, "update_product")
+            self._handle_response(response, context)
             return True
 
         except httpx.TransportError as e:
             raise RetryableConnectionError(
-                f"Connection error during update_product: {str(e)}"
+                f"Connection error during {context}: {str(e)}"
             ) from e
 
     def batch_process_products(
@@ -272,6 +512,12 @@ class IvantiRepository(BaseRepository):
         """
         Process multiple products in batch.
 
+        Products are sent one request each, unless use_batch_endpoint is
+        set. Then they are sent in a single request to the batch endpoint,
+        falling back to one request each if the API doesn't support it or
+        rejects the batch. If the batch request fails after its retries,
+        every product in it is recorded as failed.
+
         Args:
             products: List of products to process
             operation: Operation to perform ("create" or "update")
@@ -284,6 +530,154 @@ class IvantiRepository(BaseRepository):
             start_time=datetime.now(UTC)
         )
 
+        individually = not self._batch_supported
+        if not individually:
+            try:
+                item_results = self._send_batch(products, operation)
+            except RetryableAPIError as e:
+                self._record_batch_failure(result, products, operation, e)
+            except IvantiAPIError as e:
+                if e.status_code in _BATCH_UNSUPPORTED_CODES:
+                    logger.info(
+                        "Batch endpoint not supported, processing products individually"
+                    )
+                    self._batch_supported = False
+                else:
+                    logger.warning(
+                        "Batch request rejected, processing products individually",
+                        status_code=e.status_code,
+                        error=str(e)
+                    )
+                individually = True
+            except Exception as e:
+                self._record_batch_failure(result, products, operation, e)
+            else:
+                self._record_batch_results(
+                    result,
+                    products,
+                    operation,
+                    item_results
+                )
+
+        if individually:
+            self._process_products_individually(result, products, operation)
+
+        result.end_time = datetime.now(UTC)
+        return result
+
+    @_api_retry
+    def _send_batch(self, products: List[Product], operation: str) -> List[dict]:
+        """
+        Send products to the batch endpoint.
+
+        Args:
+            products: Products to send
+            operation: Operation to perform ("create" or "update")
+
+        Returns:
+            List[dict]: Per-product results, in request order
+
+        Raises:
+            IvantiAPIError: If API request fails
+            RetryableAPIError: If API returns retryable error
+            RetryableConnectionError: If connection fails temporarily
+        """
+        for product in products:
+            # Any cached copy is stale once the product is written
+            self._evict_cached_product(product.product_id)
+
+        payload = self._encode_payload({
+            "operations": [
+                {"op": operation, "product": product.to_ivanti_request()}
+                for product in products
+            ]
+        })
+
+        try:
+            response = self._request(
+                "post",
+                _BATCH_PATH,
+                content=payload,
+                headers=self._payload_headers
+            )
+            self._handle_response(response, f"batch {operation}")
+            return response.json().get("results", [])
+
+        except httpx.TransportError as e:
+            raise RetryableConnectionError(
+                f"Connection error during batch {operation}: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _record_batch_results(
+        result: SyncResult,
+        products: List[Product],
+        operation: str,
+        item_results: List[dict]
+    ) -> None:
+        """
+        Record the per-product results of a batch request.
+
+        Args:
+            result: Batch processing result to update
+            products: Products sent in the batch
+            operation: Operation performed
+            item_results: Per-product results returned by the API
+        """
+        for index, product in enumerate(products):
+            item = item_results[index] if index < len(item_results) else {}
+            status = item.get("status", 0)
+            if 200 <= status < 300:
+                result.successful_syncs += 1
+                continue
+
+            result.failed_syncs += 1
+            error = item.get("error") or (
+                f"status {status}" if status else "missing batch result"
+            )
+            result.errors[product.product_id] = f"Error during {operation}: {error}"
+
+    @staticmethod
+    def _record_batch_failure(
+        result: SyncResult,
+        products: List[Product],
+        operation: str,
+        error: Exception
+    ) -> None:
+        """
+        Record every product of a failed batch request as failed.
+
+        Args:
+            result: Batch processing result to update
+            products: Products sent in the batch
+            operation: Operation performed
+            error: Error raised by the batch request
+        """
+        logger.error(
+            f"Error during batch {operation}",
+            exc_info=True,
+            products=len(products)
+        )
+        for product in products:
+            result.failed_syncs += 1
+            result.errors[product.product_id] = (
+                f"Error during {operation}: {str(error)}"
+            )
+
+    def _process_products_individually(
+        self,
+        result: SyncResult,
+        products: List[Product],
+        operation: str
+    ) -> None:
+        """
+        Process products with one request each.
+
+        Args:
+            result: Batch processing result to update
+            products: Products to process
+            operation: Operation to perform ("create" or "update")
+        """
         for product in products:
             try:
                 if operation == "create":
@@ -306,10 +700,15 @@ class IvantiRepository(BaseRepository):
                     product_id=product.product_id
                 )
 
-        result.end_time = datetime.now(UTC)
-        return result
-
     def close(self) -> None:
         """Close repository connections."""
         if self._client:
-            self._client.close()
\ No newline at end of file
+            self._client.close()
+
+    def __enter__(self) -> 'IvantiRepository':
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
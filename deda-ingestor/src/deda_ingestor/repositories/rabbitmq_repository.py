@@ -1,7 +1,9 @@
 """RabbitMQ repository implementation."""
-import json
+import time
 from contextlib import contextmanager
-from typing import Any, Generator, Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Generator, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -9,7 +11,11 @@ from pika.credentials import PlainCredentials
 from pika.exceptions import (
     AMQPConnectionError,
     AMQPChannelError,
-    StreamLostError
+    AuthenticationError,
+    ConnectionClosedByBroker,
+    IncompatibleProtocolError,
+    ProbableAccessDeniedError,
+    ProbableAuthenticationError
 )
 
 from ..config.settings import RabbitMQConfig
@@ -24,6 +30,38 @@ from .base import MessageQueueRepository
 
 logger = get_logger()
 
+# Connection failures that reconnecting cannot fix
+_NON_RECOVERABLE_ERRORS = (
+    AuthenticationError,
+    IncompatibleProtocolError,
+    ProbableAccessDeniedError,
+    ProbableAuthenticationError
+)
+_NON_RECOVERABLE_REPLY_CODES = frozenset({
+    pika.spec.ACCESS_REFUSED,
+    pika.spec.NOT_ALLOWED
+})
+
+
+def _is_recoverable(error: AMQPConnectionError) -> bool:
+    """
+    Check whether a connection error is worth reconnecting for.
+
+    Lost streams, heartbeat timeouts and forced closes (320) are transient;
+    authentication and permission failures are not.
+
+    Args:
+        error: Connection error raised by pika
+
+    Returns:
+        bool: True if reconnecting may succeed
+    """
+    if isinstance(error, _NON_RECOVERABLE_ERRORS):
+        return False
+    if isinstance(error, ConnectionClosedByBroker):
+        return error.reply_code not in _NON_RECOVERABLE_REPLY_CODES
+    return True
+
 
 class RabbitMQRepository(MessageQueueRepository):
     """Repository for interacting with RabbitMQ."""
@@ -44,6 +82,9 @@ class RabbitMQRepository(MessageQueueRepository):
         self.config = config
         self._connection: Optional[pika.BlockingConnection] = None
         self._channel: Optional[BlockingChannel] = None
+        # (delivery tag, ack) of processed messages awaiting a multi-ack or
+        # multi-nack, in delivery order
+        self._settle_buffer: List[Tuple[int, bool]] = []
 
     def connect(self) -> None:
         """
@@ -75,6 +116,13 @@ class RabbitMQRepository(MessageQueueRepository):
                 heartbeat=600,
                 connection_attempts=3,
                 retry_delay=5,
+                socket_timeout=5,
+                # pika already sets TCP_NODELAY; enable TCP keepalive too
+                tcp_options={
+                    'TCP_KEEPIDLE': 60,
+                    'TCP_KEEPINTVL': 10,
+                    'TCP_KEEPCNT': 3
+                },
                 client_properties={
                     'connection_name': 'deda_ingestor',
                     'product': 'Deda Ingestor',
@@ -89,12 +137,18 @@ class RabbitMQRepository(MessageQueueRepository):
             logger.info("Successfully connected to RabbitMQ")
 
         except AMQPConnectionError as e:
+            details = {
+                "host": self.config.host,
+                "port": self.config.port
+            }
+            if not _is_recoverable(e):
+                raise ConnectionError(
+                    f"Failed to connect to RabbitMQ: {str(e)}",
+                    details=details
+                ) from e
             raise RetryableConnectionError(
                 f"Failed to connect to RabbitMQ: {str(e)}",
-                details={
-                    "host": self.config.host,
-                    "port": self.config.port
-                }
+                details=details
             ) from e
         except Exception as e:
             raise ConnectionError(
@@ -136,6 +190,11 @@ class RabbitMQRepository(MessageQueueRepository):
     def disconnect(self) -> None:
         """Close the RabbitMQ connection."""
         if self._connection and not self._connection.is_closed:
+            try:
+                self.flush_acks()
+            except Exception as e:
+                logger.warning(f"Error flushing acknowledgments: {str(e)}")
+
             logger.info("Closing RabbitMQ connection")
             try:
                 self._connection.close()
@@ -145,6 +204,10 @@ class RabbitMQRepository(MessageQueueRepository):
                 self._connection = None
                 self._channel = None
 
+        # Delivery tags are scoped to the channel; unacked messages are
+        # redelivered by the broker once the connection is gone
+        self._settle_buffer.clear()
+
     def is_connected(self) -> bool:
         """
         Check if connection is active.
@@ -175,27 +238,48 @@ class RabbitMQRepository(MessageQueueRepository):
         """
         Context manager to ensure connection is active.
 
+        Transient failures reopen the connection right away, so the retried
+        operation finds it ready; permanent ones are not retried.
+
         Raises:
-            RetryableConnectionError: If connection cannot be established
+            RetryableConnectionError: If the connection was lost transiently
+            ConnectionError: If the connection was closed permanently
         """
         if not self.is_connected():
             self.connect()
         try:
             yield
-        except (AMQPConnectionError, StreamLostError) as e:
+        except AMQPConnectionError as e:
+            if not _is_recoverable(e):
+                self.disconnect()
+                raise ConnectionError(
+                    "RabbitMQ closed the connection",
+                    details={"error": str(e)}
+                ) from e
+
             logger.warning("Lost connection to RabbitMQ, attempting to reconnect")
-            self.reconnect()
+            try:
+                self.reconnect()
+            except RetryableConnectionError as reconnect_error:
+                # Left disconnected; the retried operation connects again
+                logger.warning(
+                    "Reconnection to RabbitMQ failed",
+                    error=str(reconnect_error)
+                )
             raise RetryableConnectionError(
                 "Lost connection to RabbitMQ",
                 details={"error": str(e)}
             ) from e
 
-    def consume_messages(self) -> Generator[tuple[Any, int], None, None]:
+    def consume_messages(self) -> Generator[tuple[bytes, int], None, None]:
         """
         Consume messages from the queue.
 
+        Message bodies are yielded undecoded, so they can be parsed and
+        validated in a single pass by the consumer.
+
         Yields:
-            tuple[Any, int]: Tuple of (message content, delivery tag)
+            tuple[bytes, int]: Tuple of (raw message body, delivery tag)
 
         Raises:
             ConnectionError: If connection fails
@@ -203,32 +287,102 @@ class RabbitMQRepository(MessageQueueRepository):
         """
         with self._ensure_connection():
             try:
-                self._channel.basic_qos(prefetch_count=1)
+                self._channel.basic_qos(prefetch_count=self.config.prefetch_count)
                 
                 for method_frame, properties, body in self._channel.consume(
                     queue=self.config.queue,
-                    auto_ack=False
+                    auto_ack=False,
+                    inactivity_timeout=self.config.ack_flush_interval
                 ):
                     if not method_frame:
+                        # Queue is idle; don't hold back acknowledgments
+                        self.flush_acks()
                         continue
 
-                    try:
-                        message = json.loads(body.decode('utf-8'))
-                        logger.debug(
-                            "Received message",
-                            delivery_tag=method_frame.delivery_tag
-                        )
-                        yield message, method_frame.delivery_tag
+                    logger.debug(
+                        "Received message",
+                        delivery_tag=method_frame.delivery_tag
+                    )
+                    yield body, method_frame.delivery_tag
 
-                    except json.JSONDecodeError as e:
-                        logger.error(
-                            "Invalid JSON in message",
-                            error=str(e),
-                            body=body.decode('utf-8', errors='replace')
-                        )
-                        self.reject_message(method_frame.delivery_tag, requeue=False)
+            except AMQPConnectionError:
+                # Classified and recovered by _ensure_connection
+                raise
+            except AMQPChannelError as e:
+                raise MessageProcessingError(
+                    f"Channel error while consuming messages: {str(e)}"
+                ) from e
+            except Exception as e:
+                raise MessageProcessingError(
+                    f"Unexpected error while consuming messages: {str(e)}"
+                ) from e
+            finally:
+                self._stop_consuming()
+
+    def consume_batches(
+        self,
+        batch_size: int,
+        max_wait: float
+    ) -> Generator[List[tuple[bytes, int]], None, None]:
+        """
+        Consume messages from the queue in batches.
+
+        A batch is yielded once it holds batch_size messages or max_wait
+        seconds have passed since its first message. An empty batch is
+        yielded whenever the queue stays idle for max_wait seconds, so
+        callers can decide whether to keep waiting.
+
+        Args:
+            batch_size: Maximum number of messages per batch
+            max_wait: Maximum seconds to wait before yielding a partial batch
+
+        Yields:
+            List[tuple[bytes, int]]: Batch of (raw message body, delivery tag)
+
+        Raises:
+            ConnectionError: If connection fails
+            MessageProcessingError: If message processing fails
+        """
+        # The broker stops delivering once prefetch_count messages are
+        # unacked, so a larger batch could never fill up
+        batch_size = min(batch_size, self.config.prefetch_count)
+
+        with self._ensure_connection():
+            try:
+                self._channel.basic_qos(prefetch_count=self.config.prefetch_count)
+
+                batch: List[tuple[bytes, int]] = []
+                batch_started = 0.0
+                for method_frame, properties, body in self._channel.consume(
+                    queue=self.config.queue,
+                    auto_ack=False,
+                    inactivity_timeout=max_wait
+                ):
+                    if not method_frame:
+                        if not batch:
+                            self.flush_acks()
+                        yield batch
+                        batch = []
                         continue
 
+                    logger.debug(
+                        "Received message",
+                        delivery_tag=method_frame.delivery_tag
+                    )
+                    if not batch:
+                        batch_started = time.monotonic()
+                    batch.append((body, method_frame.delivery_tag))
+
+                    if (
+                        len(batch) >= batch_size
+                        or time.monotonic() - batch_started >= max_wait
+                    ):
+                        yield batch
+                        batch = []
+
+            except AMQPConnectionError:
+                # Classified and recovered by _ensure_connection
+                raise
             except AMQPChannelError as e:
                 raise MessageProcessingError(
                     f"Channel error while consuming messages: {str(e)}"
@@ -237,11 +391,26 @@ class RabbitMQRepository(MessageQueueRepository):
                 raise MessageProcessingError(
                     f"Unexpected error while consuming messages: {str(e)}"
                 ) from e
+            finally:
+                self._stop_consuming()
+
+    def _stop_consuming(self) -> None:
+        """Flush pending acknowledgments and cancel the active consumer."""
+        self.flush_acks()
+        if self.is_connected():
+            try:
+                # Returns prefetched but unprocessed messages to the queue
+                self._channel.cancel()
+            except Exception as e:
+                logger.warning(f"Error cancelling consumer: {str(e)}")
 
     def acknowledge_message(self, delivery_tag: int) -> None:
         """
         Acknowledge message processing.
 
+        The acknowledgment is buffered and sent together with others as a
+        single multi-ack once the batch is full or the queue goes idle.
+
         Args:
             delivery_tag: Message delivery tag
 
@@ -249,20 +418,16 @@ class RabbitMQRepository(MessageQueueRepository):
             ConnectionError: If connection fails
             MessageProcessingError: If acknowledgment fails
         """
-        with self._ensure_connection():
-            try:
-                self._channel.basic_ack(delivery_tag)
-                logger.debug("Acknowledged message", delivery_tag=delivery_tag)
-            except Exception as e:
-                raise MessageProcessingError(
-                    f"Failed to acknowledge message: {str(e)}",
-                    details={"delivery_tag": delivery_tag}
-                ) from e
+        self._buffer_settlement(delivery_tag, True)
 
     def reject_message(self, delivery_tag: int, requeue: bool = False) -> None:
         """
         Reject message processing.
 
+        Rejections without requeue are buffered and dead-lettered together
+        with a multi-nack, like acknowledgments. Requeued messages are
+        rejected one at a time right away.
+
         Args:
             delivery_tag: Message delivery tag
             requeue: Whether to requeue the message
@@ -271,23 +436,111 @@ class RabbitMQRepository(MessageQueueRepository):
             ConnectionError: If connection fails
             MessageProcessingError: If rejection fails
         """
+        if not requeue:
+            self._buffer_settlement(delivery_tag, False)
+            return
+
+        # Settle earlier deliveries first so a later multi-ack or
+        # multi-nack can never cover this tag
+        self.flush_acks()
         with self._ensure_connection():
             try:
-                self._channel.basic_reject(delivery_tag, requeue=requeue)
+                self._channel.basic_reject(delivery_tag, requeue=True)
                 logger.debug(
                     "Rejected message",
                     delivery_tag=delivery_tag,
-                    requeue=requeue
+                    requeue=True
                 )
+            except AMQPConnectionError:
+                raise
             except Exception as e:
                 raise MessageProcessingError(
                     f"Failed to reject message: {str(e)}",
                     details={
                         "delivery_tag": delivery_tag,
-                        "requeue": requeue
+                        "requeue": True
                     }
                 ) from e
 
+    def _buffer_settlement(self, delivery_tag: int, ack: bool) -> None:
+        """
+        Buffer a message settlement, flushing once the buffer is full.
+
+        Args:
+            delivery_tag: Message delivery tag
+            ack: True to acknowledge, False to dead-letter the message
+        """
+        self._settle_buffer.append((delivery_tag, ack))
+        logger.debug(
+            "Buffered message settlement",
+            delivery_tag=delivery_tag,
+            ack=ack
+        )
+
+        # Never hold back more settlements than the broker will deliver
+        if len(self._settle_buffer) >= min(
+            self.config.ack_batch_size,
+            self.config.prefetch_count
+        ):
+            self.flush_acks()
+
+    def flush_acks(self) -> None:
+        """
+        Send all buffered acknowledgments and rejections.
+
+        Each run of consecutive acks (or rejections) is settled in a single
+        frame with basic_ack (or basic_nack without requeue) and
+        multiple=True on the run's last tag. Messages are settled in
+        delivery order, so every lower tag still outstanding on the channel
+        belongs to that run.
+
+        Raises:
+            ConnectionError: If connection fails
+            MessageProcessingError: If settlement fails
+        """
+        if not self._settle_buffer:
+            return
+
+        if not self.is_connected():
+            # Tags from a closed channel can't be settled on a new one; the
+            # broker redelivers those messages instead
+            logger.warning(
+                "Dropping buffered settlements after connection loss",
+                count=len(self._settle_buffer)
+            )
+            self._settle_buffer.clear()
+            return
+
+        with self._ensure_connection():
+            for ack, run in groupby(self._settle_buffer, key=itemgetter(1)):
+                delivery_tag = max(tag for tag, _ in run)
+                try:
+                    if ack:
+                        self._channel.basic_ack(
+                            delivery_tag=delivery_tag,
+                            multiple=True
+                        )
+                    else:
+                        self._channel.basic_nack(
+                            delivery_tag=delivery_tag,
+                            multiple=True,
+                            requeue=False
+                        )
+                except AMQPConnectionError:
+                    raise
+                except Exception as e:
+                    raise MessageProcessingError(
+                        f"Failed to settle messages: {str(e)}",
+                        details={"delivery_tag": delivery_tag, "ack": ack}
+                    ) from e
+
+            logger.debug(
+                "Settled messages",
+                delivery_tag=self._settle_buffer[-1][0],
+                count=len(self._settle_buffer)
+            )
+            self._settle_buffer.clear()
+
     def health_check(self) -> bool:
         """
         Check repository health.
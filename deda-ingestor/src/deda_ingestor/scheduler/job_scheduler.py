@@ -4,13 +4,14 @@ from datetime import datetime
 from typing import Optional
 
 import structlog
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dependency_injector.wiring import inject, Provide
 
 from ..config.settings import SchedulerConfig
 from ..container import Container
 from ..core.product_service import ProductService
+from ..utils.retry import cancel_retries, reset_retries
 
 logger = structlog.get_logger(__name__)
 
@@ -32,14 +33,17 @@ class JobScheduler:
         """
         self.config = config
         self.product_service = product_service
-        self.scheduler = BlockingScheduler(timezone=config.timezone)
+        # Runs bookkeeping jobs only; syncing happens in run_forever()
+        self.scheduler = BackgroundScheduler(timezone=config.timezone)
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
         def shutdown(signum, frame):
+            # Runs on the main thread between consume polls; only flag the
+            # consumer to stop and don't wait for scheduler jobs here
             logger.info("Received shutdown signal", signal=signum)
-            self.stop()
+            self.stop(wait=False)
 
         signal.signal(signal.SIGINT, shutdown)
         signal.signal(signal.SIGTERM, shutdown)
@@ -91,33 +95,50 @@ class JobScheduler:
                 error=str(e)
             )
 
+    def _report_status(self) -> None:
+        """Execute the periodic health check and sync report job."""
+        try:
+            self.product_service.report()
+            if not self.product_service.health_check():
+                logger.warning("Repositories are not healthy")
+        except Exception as e:
+            logger.exception("Error during status report", error=str(e))
+
     def start(self) -> None:
-        """Start the scheduler."""
+        """
+        Start continuous synchronization.
+
+        Messages are consumed as soon as they arrive; the configured
+        schedule time only triggers a daily health check and sync report.
+        Blocks until stop() is called.
+        """
+        # Retries may still be cancelled by a previous stop()
+        reset_retries()
         try:
             hour, minute = self._parse_schedule_time()
             
-            # Schedule the job to run daily at the configured time
+            # Report daily at the configured time
             self.scheduler.add_job(
-                self._sync_products,
+                self._report_status,
                 CronTrigger(
                     hour=hour,
                     minute=minute,
                     timezone=self.config.timezone
                 ),
-                name="product_sync",
-                id="product_sync_job",
+                name="sync_report",
+                id="sync_report_job",
                 replace_existing=True,
                 max_instances=1,  # Ensure only one instance runs at a time
             )
+            self.scheduler.start()
 
             logger.info(
                 "Scheduler started",
-                schedule_time=f"{hour:02d}:{minute:02d}",
+                report_time=f"{hour:02d}:{minute:02d}",
                 timezone=self.config.timezone
             )
 
-            # Start the scheduler
-            self.scheduler.start()
+            self.product_service.run_forever()
 
         except (KeyboardInterrupt, SystemExit):
             self.stop()
@@ -125,10 +146,18 @@ class JobScheduler:
             logger.exception("Error starting scheduler", error=str(e))
             raise
 
-    def stop(self) -> None:
-        """Stop the scheduler."""
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop continuous synchronization and the scheduler.
+
+        Args:
+            wait: Whether to wait for running scheduler jobs to finish
+        """
         logger.info("Stopping scheduler")
-        self.scheduler.shutdown()
+        self.product_service.stop()
+        cancel_retries()
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=wait)
 
     def run_now(self) -> None:
         """Run the synchronization job immediately."""
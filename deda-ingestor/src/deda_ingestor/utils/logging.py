@@ -1,97 +1,227 @@
 """Logging configuration using loguru."""
+import atexit
+import gzip
+import os
+import shutil
 import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from itertools import islice
+from typing import Any, Dict, Optional, Tuple, Union
 
+import orjson
 from loguru import logger
 
 from ..config.settings import LogConfig
 
+_CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+_FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | "
+    "{level: <8} | "
+    "process:{process} | "
+    "thread:{thread} | "
+    "{name}:{function}:{line} | "
+    "{message}"
+)
+_SYNC_REPORT_TYPE = "sync"
+
+# Bound once instead of on every report; the report itself is passed as a
+# kwarg, which loguru also stores in the record extras
+_SYNC_LOGGER = logger.bind(report_type=_SYNC_REPORT_TYPE)
+
+# Block-buffer the high-volume app log instead of one write() per line;
+# loguru flushes it when the sinks are removed at exit, so a hard kill can
+# lose its unwritten tail. Low-volume sinks stay line-buffered.
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# Rotated files are compressed off the logging thread, one at a time
+_COMPRESSION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="log-compression"
+)
+
+# Set once the exit hook draining the file sink queues is registered
+_EXIT_HOOK_REGISTERED = False
+
+# Longest string, and most items of a dict or list, copied from an
+# exception attribute by format_error_context()
+_MAX_ERROR_ATTR_CHARS = 256
+_MAX_ERROR_ATTR_ITEMS = 32
+
+# Handler IDs of the installed sinks, keyed by sink target and settings
+_SINK_IDS: Dict[Tuple, int] = {}
+
 
 def configure_logging(config: LogConfig) -> None:
     """
     Configure loguru logger with appropriate sinks and formats.
 
+    Sinks whose settings are unchanged since the last call are kept as they
+    are; only changed sinks are reopened, and stale ones removed.
+
     Args:
         config: Logging configuration
     """
-    # Remove default handler
-    logger.remove()
+    # Extended tracebacks walk the stack and repr every local variable, so
+    # they are only rendered when debugging
+    debug = config.level == "DEBUG"
+
+    sinks: Dict[Tuple, Tuple[Any, Dict[str, Any]]] = {}
 
     # Add console handler with custom format
-    logger.add(
+    _add_sink(
+        sinks,
         sys.stderr,
-        format=_get_console_format(),
+        format=_CONSOLE_FORMAT,
         level=config.level,
-        backtrace=True,
-        diagnose=True,
+        backtrace=debug,
+        diagnose=debug,
     )
 
-    # Add file handler for general logs
-    logger.add(
+    # Add file handler for general logs; file sinks are written by a
+    # background worker (enqueue), so callers never block on disk I/O
+    _add_sink(
+        sinks,
         config.directory / config.app_log_file,
-        format=_get_file_format(),
+        format=_FILE_FORMAT,
         level=config.level,
         rotation="10 MB",
         retention="30 days",
-        compression="gz",
-        serialize=True,
-        backtrace=True,
-        diagnose=True,
+        compression=_compress_in_background,
+        backtrace=False,
+        diagnose=False,
+        enqueue=True,
+        buffering=_FILE_BUFFER_SIZE,
     )
 
-    # Add file handler for error logs
-    logger.add(
+    # Add file handler for error logs; kept line-buffered so errors reach
+    # the disk immediately
+    _add_sink(
+        sinks,
         config.directory / config.error_log_file,
-        format=_get_file_format(),
+        format=_FILE_FORMAT,
         level="ERROR",
         rotation="10 MB",
         retention="60 days",
-        compression="gz",
-        serialize=True,
-        backtrace=True,
-        diagnose=True,
+        compression=_compress_in_background,
+        backtrace=debug,
+        diagnose=debug,
+        enqueue=True,
     )
 
-    # Add file handler for sync reports
-    logger.add(
+    # Add file handler for sync reports; kept line-buffered, as a report is
+    # written about once a day and must survive a crash
+    _add_sink(
+        sinks,
         config.directory / config.sync_report_file,
-        format=_get_report_format(),
+        format=_format_report,
         level="INFO",
         filter=_is_sync_report,
         rotation="1 day",
         retention="90 days",
-        compression="gz",
-        serialize=True,
+        compression=_compress_in_background,
+        enqueue=True,
     )
 
+    _install_sinks(sinks)
 
-def _get_console_format() -> str:
-    """Get format string for console output."""
-    return (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>"
-    )
 
+def _add_sink(
+    sinks: Dict[Tuple, Tuple[Any, Dict[str, Any]]],
+    sink: Any,
+    **options: Any
+) -> None:
+    """
+    Register a sink to install, keyed by its target and settings.
+
+    Args:
+        sinks: Sinks to install, keyed by settings
+        sink: Loguru sink
+        **options: Options passed to logger.add()
+    """
+    key = (str(sink), tuple((name, repr(value)) for name, value in options.items()))
+    sinks[key] = (sink, options)
 
-def _get_file_format() -> str:
-    """Get format string for file output."""
-    return (
-        "{time:YYYY-MM-DD HH:mm:ss} | "
-        "{level: <8} | "
-        "process:{process} | "
-        "thread:{thread} | "
-        "{name}:{function}:{line} | "
-        "{message}"
-    )
 
+def _install_sinks(sinks: Dict[Tuple, Tuple[Any, Dict[str, Any]]]) -> None:
+    """
+    Install sinks, reusing the handlers of sinks that are already installed.
 
-def _get_report_format() -> str:
-    """Get format string for sync reports."""
-    return "{message}"
+    Args:
+        sinks: Sinks to install, keyed by settings
+    """
+    if not _SINK_IDS:
+        # First configuration: drop loguru's default handler
+        logger.remove()
+
+    for key in _SINK_IDS.keys() - sinks.keys():
+        logger.remove(_SINK_IDS.pop(key))
+
+    for key, (sink, options) in sinks.items():
+        if key not in _SINK_IDS:
+            _SINK_IDS[key] = logger.add(sink, **options)
+
+
+def close_logging() -> None:
+    """Remove the sinks installed by configure_logging, flushing the files."""
+    while _SINK_IDS:
+        _, handler_id = _SINK_IDS.popitem()
+        logger.remove(handler_id)
+
+
+def _compress_in_background(path: str) -> None:
+    """
+    Schedule gzip compression of a rotated log file.
+
+    Loguru calls this during rotation; compressing inline would stall
+    logging for the whole file, so the work is handed to a worker thread.
+
+    Args:
+        path: Path of the rotated log file
+    """
+    _COMPRESSION_EXECUTOR.submit(_gzip_file, path)
+
+
+def _gzip_file(path: str) -> None:
+    """
+    Compress a file with fast gzip and remove the original.
+
+    Args:
+        path: Path of the file to compress
+    """
+    try:
+        with open(path, "rb") as f_in:
+            with gzip.open(f"{path}.gz", "wb", compresslevel=1) as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        os.remove(path)
+    except OSError as e:
+        # Keep the uncompressed file; never let compression kill logging
+        sys.stderr.write(f"Failed to compress log file {path}: {e}\n")
+
+
+def _format_report(record: Dict[str, Any]) -> str:
+    """
+    Render a sync report record as a single JSON line.
+
+    Only the report itself is serialized, with orjson, rather than the whole
+    loguru record.
+
+    Args:
+        record: Log record
+
+    Returns:
+        str: Format string referencing the serialized report
+    """
+    record["extra"]["report_json"] = orjson.dumps(
+        record["extra"].get("report", record["message"]),
+        default=str
+    ).decode()
+    return "{extra[report_json]}\n"
 
 
 def _is_sync_report(record: Dict[str, Any]) -> bool:
@@ -104,7 +234,7 @@ def _is_sync_report(record: Dict[str, Any]) -> bool:
     Returns:
         bool: True if record is a sync report
     """
-    return record["extra"].get("report_type") == "sync"
+    return record["extra"].get("report_type") == _SYNC_REPORT_TYPE
 
 
 def init_logging(config: LogConfig) -> None:
@@ -114,7 +244,15 @@ def init_logging(config: LogConfig) -> None:
     Args:
         config: Logging configuration
     """
+    global _EXIT_HOOK_REGISTERED
+
+    # Created once here rather than whenever the sinks are reconfigured
+    config.directory.mkdir(parents=True, exist_ok=True)
     configure_logging(config)
+    if not _EXIT_HOOK_REGISTERED:
+        # Drain records still queued for the file sinks on interpreter exit
+        atexit.register(logger.complete)
+        _EXIT_HOOK_REGISTERED = True
 
 
 def get_logger():
@@ -136,7 +274,9 @@ def log_exception(
         level: Log level
     """
     context = context or {}
-    logger.opt(exception=True).log(
+    # Only capture the traceback for records at ERROR level or above
+    capture = logger.level(level).no >= logger.level("ERROR").no
+    logger.opt(exception=exc if capture else None).log(
         level,
         "Exception occurred: {exc}",
         exc=str(exc),
@@ -151,8 +291,8 @@ def log_sync_report(report_data: Dict[str, Any]) -> None:
     Args:
         report_data: Report data to log
     """
-    report_data["timestamp"] = datetime.utcnow().isoformat()
-    logger.bind(report_type="sync").info(report_data)
+    report_data["timestamp"] = datetime.now(UTC).isoformat()
+    _SYNC_LOGGER.info("Sync report", report=report_data)
 
 
 def format_error_context(
@@ -169,30 +309,45 @@ def format_error_context(
     Returns:
         Dict[str, Any]: Formatted error context
     """
+    is_exception = isinstance(error, Exception)
     error_context = {
-        "error_type": type(error).__name__ if isinstance(error, Exception) else "str",
+        "error_type": type(error).__name__ if is_exception else "str",
         "error_message": str(error),
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(UTC).isoformat()
     }
 
     if context:
         error_context.update(context)
 
-    if isinstance(error, Exception) and hasattr(error, "__dict__"):
+    if is_exception and hasattr(error, "__dict__"):
         error_context.update({
-            k: v for k, v in error.__dict__.items()
-            if not k.startswith("_") and isinstance(v, (str, int, float, bool, dict, list))
+            k: _cap_error_attr(v) for k, v in vars(error).items()
+            if not k.startswith("_")
+            and isinstance(v, (str, int, float, bool, dict, list))
         })
 
     return error_context
 
 
-# Initialize logger with default configuration for tests
-if "pytest" in sys.modules:
-    init_logging(LogConfig(
-        level="DEBUG",
-        directory=Path("tests/logs"),
-        app_log_file="test_app.log",
-        error_log_file="test_error.log",
-        sync_report_file="test_sync_report.log"
-    ))
\ No newline at end of file
+def _cap_error_attr(value: Any) -> Any:
+    """
+    Cap an exception attribute copied into an error context.
+
+    Attributes such as response payloads can be arbitrarily large, so long
+    strings are truncated and only the first items of dicts and lists are
+    kept.
+
+    Args:
+        value: Attribute value
+
+    Returns:
+        Any: The value, truncated if oversized
+    """
+    if isinstance(value, str) and len(value) > _MAX_ERROR_ATTR_CHARS:
+        return value[:_MAX_ERROR_ATTR_CHARS] + "..."
+    if isinstance(value, dict) and len(value) > _MAX_ERROR_ATTR_ITEMS:
+        return dict(islice(value.items(), _MAX_ERROR_ATTR_ITEMS))
+    if isinstance(value, list) and len(value) > _MAX_ERROR_ATTR_ITEMS:
+        return value[:_MAX_ERROR_ATTR_ITEMS]
+    return value
+
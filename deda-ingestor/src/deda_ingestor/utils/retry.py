@@ -1,17 +1,37 @@
 """Retry decorator with exponential backoff."""
+import asyncio
+import atexit
 import functools
 import random
-import time
-from typing import Any, Callable, Optional, Type, Union, Tuple
+import threading
+import weakref
+from typing import Any, Callable, Iterator, Optional, Type, Union, Tuple
 
 from loguru import logger
 
 from ..core.exceptions import RetryableError
 
+# Set on shutdown to wake up and abandon pending retries; cleared again by
+# reset_retries() when work restarts in the same process
+_SHUTDOWN = threading.Event()
+
+# Per event loop counterpart of _SHUTDOWN, waking async retries; guarded by
+# _ASYNC_SHUTDOWN_LOCK since cancel_retries() may run on any thread
+_ASYNC_SHUTDOWN: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_ASYNC_SHUTDOWN_LOCK = threading.Lock()
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
 
+    __slots__ = (
+        "max_attempts",
+        "base_delay",
+        "max_delay",
+        "exponential_base",
+        "jitter",
+    )
+
     def __init__(
         self,
         max_attempts: int = 3,
@@ -37,6 +57,188 @@ class RetryConfig:
         self.jitter = jitter
 
 
+def cancel_retries() -> None:
+    """
+    Abandon pending retries for shutdown.
+
+    Operations waiting to be retried stop waiting and raise their last
+    error, and no further retries are attempted.
+    """
+    _SHUTDOWN.set()
+    with _ASYNC_SHUTDOWN_LOCK:
+        waiters = list(_ASYNC_SHUTDOWN.items())
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # Loop already closed, nothing is waiting on it
+            pass
+
+
+def reset_retries() -> None:
+    """
+    Allow retries again after cancel_retries().
+
+    Called when work starts, so a stop/start cycle in the same process
+    does not leave every later retry cancelled.
+    """
+    with _ASYNC_SHUTDOWN_LOCK:
+        # Async waits register fresh events from now on
+        _ASYNC_SHUTDOWN.clear()
+    _SHUTDOWN.clear()
+
+
+atexit.register(cancel_retries)
+
+
+async def _async_shutdown_wait(delay: float) -> bool:
+    """
+    Sleep before an async retry, waking up early on shutdown.
+
+    Args:
+        delay: Delay in seconds
+
+    Returns:
+        bool: True if retries were cancelled
+    """
+    loop = asyncio.get_running_loop()
+    with _ASYNC_SHUTDOWN_LOCK:
+        event = _ASYNC_SHUTDOWN.get(loop)
+        if event is None:
+            event = _ASYNC_SHUTDOWN[loop] = asyncio.Event()
+
+    # Checked after registering, so a concurrent cancel_retries() either
+    # sees the event or is seen here
+    if _SHUTDOWN.is_set():
+        return True
+    try:
+        await asyncio.wait_for(event.wait(), delay)
+    except asyncio.TimeoutError:
+        return _SHUTDOWN.is_set()
+    return True
+
+
+def _backoff_delays(config: RetryConfig) -> Tuple[float, ...]:
+    """
+    Precompute the backoff delay before each retry, without jitter.
+
+    Args:
+        config: Retry configuration
+
+    Returns:
+        Tuple[float, ...]: Delay in seconds after each failed attempt
+    """
+    return tuple(
+        min(config.base_delay * config.exponential_base ** i, config.max_delay)
+        for i in range(config.max_attempts - 1)
+    )
+
+
+def _iter_delays(
+    base_delays: Tuple[float, ...],
+    jitter: bool
+) -> Iterator[Tuple[int, float]]:
+    """
+    Iterate over the retries of an operation.
+
+    Args:
+        base_delays: Precomputed backoff delays
+        jitter: Whether to add random jitter to delays
+
+    Yields:
+        Tuple[int, float]: Failed attempt number and delay before the retry
+    """
+    for attempt, delay in enumerate(base_delays, start=1):
+        if jitter:
+            delay = random.uniform(delay * 0.5, delay * 1.5)
+        yield attempt, delay
+
+
+def _before_retry(
+    func: Callable,
+    error: Exception,
+    attempt: int,
+    delay: float,
+    on_retry: Optional[Callable[[Exception, int], None]]
+) -> None:
+    """
+    Log a retry attempt and execute the retry callback, if any.
+
+    Args:
+        func: Function being retried
+        error: Error of the failed attempt
+        attempt: Failed attempt number
+        delay: Delay before the retry in seconds
+        on_retry: Callback function to execute before the retry
+    """
+    # Exceptions are only stringified if a sink actually emits the record
+    logger.opt(lazy=True).warning(
+        "Operation failed, retrying",
+        function=lambda: func.__name__,
+        attempt=lambda: attempt,
+        next_attempt_in=lambda: f"{delay:.2f}s",
+        error=lambda: str(error)
+    )
+
+    if on_retry:
+        try:
+            on_retry(error, attempt)
+        except Exception as callback_error:
+            logger.error(
+                "Error in retry callback",
+                error=str(callback_error)
+            )
+
+
+def _log_non_retryable(func: Callable, error: Exception) -> None:
+    """
+    Log an error that is not retried.
+
+    Args:
+        func: Function that failed
+        error: Non-retryable error
+    """
+    logger.opt(lazy=True).error(
+        "Non-retryable error occurred",
+        function=lambda: func.__name__,
+        error=lambda: str(error)
+    )
+
+
+def _log_cancelled(func: Callable, error: Exception, attempt: int) -> None:
+    """
+    Log a retry abandoned because of shutdown.
+
+    Args:
+        func: Function that failed
+        error: Error of the last attempt
+        attempt: Failed attempt number
+    """
+    logger.opt(lazy=True).warning(
+        "Retry cancelled for shutdown",
+        function=lambda: func.__name__,
+        attempt=lambda: attempt,
+        error=lambda: str(error)
+    )
+
+
+def _log_exhausted(func: Callable, error: Exception, attempts: int) -> None:
+    """
+    Log that every retry attempt failed.
+
+    Args:
+        func: Function that failed
+        error: Error of the last attempt
+        attempts: Number of attempts made
+    """
+    logger.opt(lazy=True).error(
+        "Max retry attempts reached",
+        function=lambda: func.__name__,
+        attempt=lambda: attempts,
+        error=lambda: str(error)
+    )
+
+
 def retry_with_backoff(
     retryable_exceptions: Union[
         Type[Exception],
@@ -57,74 +259,37 @@ def retry_with_backoff(
         Callable: Decorated function
     """
     config = config or RetryConfig()
+    base_delays = _backoff_delays(config)
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            attempt = 1
-            last_exception = None
+            # Fast path: most calls succeed on the first attempt
+            try:
+                return func(*args, **kwargs)
+            except retryable_exceptions as e:
+                last_exception = e
+            except Exception as e:
+                _log_non_retryable(func, e)
+                raise
+
+            for attempt, delay in _iter_delays(base_delays, config.jitter):
+                _before_retry(func, last_exception, attempt, delay, on_retry)
+                if _SHUTDOWN.wait(delay):
+                    # Shutting down, give up instead of retrying
+                    _log_cancelled(func, last_exception, attempt)
+                    raise last_exception
 
-            while attempt <= config.max_attempts:
                 try:
                     return func(*args, **kwargs)
-
                 except retryable_exceptions as e:
                     last_exception = e
-
-                    # Check if we should retry
-                    if attempt == config.max_attempts:
-                        logger.error(
-                            "Max retry attempts reached",
-                            function=func.__name__,
-                            attempt=attempt,
-                            error=str(e)
-                        )
-                        raise
-
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        config.base_delay * (config.exponential_base ** (attempt - 1)),
-                        config.max_delay
-                    )
-
-                    # Add jitter if enabled
-                    if config.jitter:
-                        delay = delay * (0.5 + random.random())
-
-                    # Log retry attempt
-                    logger.warning(
-                        "Operation failed, retrying",
-                        function=func.__name__,
-                        attempt=attempt,
-                        next_attempt_in=f"{delay:.2f}s",
-                        error=str(e)
-                    )
-
-                    # Execute retry callback if provided
-                    if on_retry:
-                        try:
-                            on_retry(e, attempt)
-                        except Exception as callback_error:
-                            logger.error(
-                                "Error in retry callback",
-                                error=str(callback_error)
-                            )
-
-                    # Wait before retrying
-                    time.sleep(delay)
-                    attempt += 1
-
                 except Exception as e:
-                    # Log non-retryable exceptions
-                    logger.error(
-                        "Non-retryable error occurred",
-                        function=func.__name__,
-                        error=str(e)
-                    )
+                    _log_non_retryable(func, e)
                     raise
 
-            # This should never be reached due to the raise in the last iteration
-            raise last_exception or Exception("Retry loop completed without success")
+            _log_exhausted(func, last_exception, config.max_attempts)
+            raise last_exception
 
         return wrapper
 
@@ -151,68 +316,38 @@ def retry_async_with_backoff(
         Callable: Decorated async function
     """
     config = config or RetryConfig()
+    base_delays = _backoff_delays(config)
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            import asyncio
-            attempt = 1
-            last_exception = None
+            # Fast path: most calls succeed on the first attempt
+            try:
+                return await func(*args, **kwargs)
+            except retryable_exceptions as e:
+                last_exception = e
+            except Exception as e:
+                _log_non_retryable(func, e)
+                raise
+
+            for attempt, delay in _iter_delays(base_delays, config.jitter):
+                _before_retry(func, last_exception, attempt, delay, on_retry)
+                if await _async_shutdown_wait(delay):
+                    # Shutting down, give up instead of retrying
+                    _log_cancelled(func, last_exception, attempt)
+                    raise last_exception
 
-            while attempt <= config.max_attempts:
                 try:
                     return await func(*args, **kwargs)
-
                 except retryable_exceptions as e:
                     last_exception = e
-
-                    if attempt == config.max_attempts:
-                        logger.error(
-                            "Max retry attempts reached",
-                            function=func.__name__,
-                            attempt=attempt,
-                            error=str(e)
-                        )
-                        raise
-
-                    delay = min(
-                        config.base_delay * (config.exponential_base ** (attempt - 1)),
-                        config.max_delay
-                    )
-
-                    if config.jitter:
-                        delay = delay * (0.5 + random.random())
-
-                    logger.warning(
-                        "Operation failed, retrying",
-                        function=func.__name__,
-                        attempt=attempt,
-                        next_attempt_in=f"{delay:.2f}s",
-                        error=str(e)
-                    )
-
-                    if on_retry:
-                        try:
-                            on_retry(e, attempt)
-                        except Exception as callback_error:
-                            logger.error(
-                                "Error in retry callback",
-                                error=str(callback_error)
-                            )
-
-                    await asyncio.sleep(delay)
-                    attempt += 1
-
                 except Exception as e:
-                    logger.error(
-                        "Non-retryable error occurred",
-                        function=func.__name__,
-                        error=str(e)
-                    )
+                    _log_non_retryable(func, e)
                     raise
 
-            raise last_exception or Exception("Retry loop completed without success")
+            _log_exhausted(func, last_exception, config.max_attempts)
+            raise last_exception
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
@@ -0,0 +1,27 @@
+"""Parsing of ISO-8601 timestamps from API responses."""
+from datetime import datetime
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # Optional "iso8601" extra
+    _parse_datetime = None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, including a "Z" UTC designator.
+
+    Uses the ciso8601 C parser when installed.
+
+    Args:
+        value: ISO-8601 timestamp
+
+    Returns:
+        datetime: Parsed timestamp
+
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    if _parse_datetime is not None:
+        return _parse_datetime(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
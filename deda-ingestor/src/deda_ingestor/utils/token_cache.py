@@ -0,0 +1,121 @@
+"""On-disk cache of access tokens shared across process runs."""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import orjson
+from loguru import logger
+
+
+def token_cache_key(client_id: str, client_secret: str, token_url: str) -> str:
+    """
+    Get the cache key for a client's tokens.
+
+    The secret is part of the key, so tokens cached before a secret
+    rotation are not served afterwards.
+
+    Args:
+        client_id: OAuth2 client ID
+        client_secret: OAuth2 client secret
+        token_url: Token endpoint URL
+
+    Returns:
+        str: Cache key, usable as a file name
+    """
+    return hashlib.sha256(
+        f"{client_id}\0{client_secret}\0{token_url}".encode()
+    ).hexdigest()
+
+
+def load_token(directory: Path, key: str) -> Optional[Tuple[str, float]]:
+    """
+    Load a cached access token.
+
+    Symlinks are not followed, so the cache can't be pointed at another
+    file. Unreadable entries are treated as missing.
+
+    Args:
+        directory: Cache directory
+        key: Cache key
+
+    Returns:
+        Optional[Tuple[str, float]]: Access token and expiry as a UNIX
+            timestamp if cached
+    """
+    path = directory / key
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        with os.fdopen(fd, "rb") as f:
+            entry = orjson.loads(f.read())
+        return entry["access_token"], float(entry["expires_at"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(
+            "Ignoring unreadable token cache",
+            path=str(path),
+            error=str(e)
+        )
+        return None
+
+
+def save_token(
+    directory: Path,
+    key: str,
+    access_token: str,
+    expires_at: float
+) -> None:
+    """
+    Cache an access token.
+
+    The entry is written to a private temporary file and atomically renamed
+    into place, so concurrent runs never read a partial entry.
+
+    Args:
+        directory: Cache directory
+        key: Cache key
+        access_token: Access token
+        expires_at: Token expiry as a UNIX timestamp
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file readable by the owner only
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({
+                    "access_token": access_token,
+                    "expires_at": expires_at
+                }))
+            os.replace(tmp_path, directory / key)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(
+            "Failed to write token cache",
+            directory=str(directory),
+            error=str(e)
+        )
+
+
+def delete_token(directory: Path, key: str) -> None:
+    """
+    Drop a cached access token.
+
+    Args:
+        directory: Cache directory
+        key: Cache key
+    """
+    try:
+        (directory / key).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(
+            "Failed to delete token cache",
+            directory=str(directory),
+            error=str(e)
+        )
@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures."""
 import os
+import shutil
 from pathlib import Path
 
 # Set test environment first
@@ -8,11 +9,12 @@ os.environ["ENVIRONMENT"] = "test"
 # Configure test paths
 TEST_DIR = Path(__file__).parent
 FIXTURES_DIR = TEST_DIR / "fixtures"
-LOG_DIR = TEST_DIR / "logs"
+# One log directory per pytest-xdist worker, so workers never clean up
+# each other's files
+LOG_DIR = TEST_DIR / "logs" / os.environ.get("PYTEST_XDIST_WORKER", "main")
 
-# Create test directories
+# Create test directories; init_logging creates LOG_DIR
 FIXTURES_DIR.mkdir(exist_ok=True)
-LOG_DIR.mkdir(exist_ok=True)
 
 # Configure test environment variables before any imports
 os.environ.update({
@@ -32,11 +34,17 @@ os.environ.update({
 })
 
 # Import after environment setup
+import datetime
+import uuid
+from datetime import UTC
+from decimal import Decimal
+
 import pytest
 from loguru import logger
 
-from deda_ingestor.config.settings import LogConfig
-from deda_ingestor.utils.logging import init_logging
+from deda_ingestor.config.settings import IvantiConfig, LogConfig
+from deda_ingestor.core.models import Product, ProductElement
+from deda_ingestor.utils.logging import close_logging, init_logging
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -56,57 +64,97 @@ def setup_logging():
     
     # Initialize logging
     init_logging(log_config)
-    
-    yield
-    
-    # Cleanup logs after all tests
-    logger.remove()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def cleanup_logs():
-    """Clean up log files after each test."""
+    """Clean up log files, including rotated archives, after all tests."""
     yield
     
-    # Clean up log files
-    if LOG_DIR.exists():
-        for log_file in LOG_DIR.glob("*.log"):
-            try:
-                log_file.unlink()
-            except FileNotFoundError:
-                pass
+    # Close the file sinks before deleting their files
+    close_logging()
+    shutil.rmtree(LOG_DIR, ignore_errors=True)
+
+
+class MockDateTime:
+    """Datetime replacement returning a fixed time."""
+    FIXED_NOW = datetime.datetime(2024, 1, 23, 12, 0, tzinfo=UTC)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.FIXED_NOW
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now(UTC)
+
+
+class MockUUID:
+    """UUID factory returning predictable, increasing values."""
+    _next_id = 1
+
+    @classmethod
+    def uuid4(cls):
+        uuid_str = f"00000000-0000-0000-0000-{cls._next_id:012d}"
+        cls._next_id += 1
+        return uuid.UUID(uuid_str)
 
 
 @pytest.fixture(autouse=True)
-def mock_datetime(monkeypatch):
-    """Mock datetime to return a fixed value."""
-    import datetime
-    from datetime import UTC
-    
-    class MockDateTime:
-        @classmethod
-        def now(cls, tz=None):
-            return datetime.datetime(2024, 1, 23, 12, 0, tzinfo=UTC)
-        
-        @classmethod
-        def utcnow(cls):
-            return cls.now(UTC)
-    
+def deterministic(monkeypatch):
+    """Mock datetime and UUID generation to return predictable values."""
+    MockUUID._next_id = 1
     monkeypatch.setattr(datetime, 'datetime', MockDateTime)
+    monkeypatch.setattr(uuid, 'uuid4', MockUUID.uuid4)
 
 
-@pytest.fixture(autouse=True)
-def mock_uuid(monkeypatch):
-    """Mock UUID to return predictable values."""
-    import uuid
-    
-    class MockUUID:
-        _next_id = 1
-        
-        @classmethod
-        def uuid4(cls):
-            uuid_str = f"00000000-0000-0000-0000-{cls._next_id:012d}"
-            cls._next_id += 1
-            return uuid.UUID(uuid_str)
-    
-    monkeypatch.setattr(uuid, 'uuid4', MockUUID.uuid4)
\ No newline at end of file
+@pytest.fixture(scope="session")
+def ivanti_config() -> IvantiConfig:
+    """Fixture for Ivanti configuration, shared by every test."""
+    return IvantiConfig(
+        api_url="https://ivanti-api.example.com",
+        api_key="test-api-key",
+        client_id="test-client-id",
+        client_secret="test-client-secret",
+        token_url="https://ivanti-api.example.com/oauth/token",
+        request_timeout=30,
+        max_retries=3,
+        retry_delay=1
+    )
+
+
+@pytest.fixture
+def sample_product(deterministic) -> Product:
+    """Fixture for sample product data, created at the mocked time."""
+    return Product(
+        product_id="PROD-123",
+        product_name="Test Product",
+        product_elements=[
+            ProductElement(
+                Lenght=50,
+                **{
+                    "Procuct Element": "Element 1",
+                    "Type": "Hardware",
+                    "GG Startup": 3,
+                    "RU": "RU1",
+                    "RU Qty": 10,
+                    "RU Unit of measure": "Days",
+                    "Q.ty min": 1,
+                    "Q.ty MAX": 100,
+                    "%Sconto MAX": Decimal("15"),
+                    "Startup Costo": Decimal("500.0"),
+                    "Startup Margine": Decimal("20"),
+                    "Startup Prezzo": Decimal("600.0"),
+                    "Canone Costo Mese": Decimal("100.0"),
+                    "Canone Margine": Decimal("10"),
+                    "Canone Prezzo Mese": Decimal("110.0"),
+                    "Extended Description": "Test Description",
+                    "Profit Center Prevalente": "PC001",
+                    "Status": "Active",
+                    "Note": "Test Note",
+                    "Object": "REF001"
+                }
+            )
+        ],
+        created_at=datetime.datetime.now(UTC)
+    )
@@ -1,7 +1,8 @@
 """Tests for Ivanti repository integration."""
-from datetime import datetime, UTC
+from dataclasses import replace
 from decimal import Decimal
 import json
+from typing import Any, Optional
 from unittest.mock import Mock, patch
 
 import httpx
@@ -10,47 +11,154 @@ from pytest_mock import MockerFixture
 
 from deda_ingestor.core.exceptions import (
     AuthenticationError,
+    ConfigurationError,
     IvantiAPIError,
     RetryableAPIError
 )
-from deda_ingestor.core.models import Product, ProductElement
+from deda_ingestor.core.models import Product
 from deda_ingestor.config.settings import IvantiConfig
 from deda_ingestor.repositories.ivanti_repository import IvantiRepository
 
 
+AUTH_RESPONSE = {
+    "access_token": "test-token",
+    "token_type": "Bearer",
+    "expires_in": 3600
+}
+
+PRODUCT_RESPONSE = {
+    "id": "PROD-123",
+    "name": "Test Product",
+    "elements": [
+        {
+            "id": "ELEM-001",
+            "name": "Element 1",
+            "type": "Hardware",
+            "startup_days": 3,
+            "resource_unit": "RU1",
+            "resource_unit_qty": 10,
+            "resource_unit_measure": "Days",
+            "quantity_min": 1,
+            "quantity_max": 100,
+            "max_discount_percentage": 15.0,
+            "startup_cost": 500.0,
+            "startup_margin": 20.0,
+            "startup_price": 600.0,
+            "monthly_fee_cost": 100.0,
+            "monthly_fee_margin": 10.0,
+            "monthly_fee_price": 110.0,
+            "extended_description": "Test Description",
+            "profit_center": "PC001",
+            "status": "Active",
+            "notes": "Test Note",
+            "object_reference": "REF001",
+            "length": 50
+        }
+    ],
+    "status": "Active",
+    "created_at": "2024-01-23T12:00:00Z",
+    "updated_at": "2024-01-23T12:00:00Z"
+}
+
+
+# Decoded request payload expected for the sample product
+SAMPLE_PRODUCT_PAYLOAD = {
+    "id": "PROD-123",
+    "name": "Test Product",
+    "elements": [{
+        "name": "Element 1",
+        "type": "Hardware",
+        "startup_days": 3,
+        "resource_unit": "RU1",
+        "resource_unit_qty": 10,
+        "resource_unit_measure": "Days",
+        "quantity_min": 1,
+        "quantity_max": 100,
+        "max_discount_percentage": 15.0,
+        "startup_cost": 500.0,
+        "startup_margin": 20.0,
+        "startup_price": 600.0,
+        "monthly_fee_cost": 100.0,
+        "monthly_fee_margin": 10.0,
+        "monthly_fee_price": 110.0,
+        "extended_description": "Test Description",
+        "profit_center": "PC001",
+        "status": "Active",
+        "notes": "Test Note",
+        "object_reference": "REF001",
+        "length": 50
+    }],
+    "created_at": "2024-01-23T12:00:00+00:00",
+    "updated_at": None
+}
+
+
+def make_response(
+    status_code: int,
+    body: Any = None,
+    error: Optional[str] = None,
+    headers: Optional[dict] = None
+) -> Mock:
+    """
+    Build a mocked HTTP response.
+
+    Args:
+        status_code: HTTP status code
+        body: Parsed JSON body
+        error: Message of the HTTPStatusError raised by raise_for_status,
+            if any
+        headers: Response headers
+
+    Returns:
+        Mock: Mocked httpx.Response
+    """
+    response = Mock(spec=httpx.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    response.raise_for_status = Mock(
+        side_effect=httpx.HTTPStatusError(
+            error,
+            request=Mock(),
+            response=response
+        ) if error else None
+    )
+    return response
+
+
+def make_status_response(status_code: int) -> Mock:
+    """
+    Build a mocked HTTP response for a status code, failing on errors.
+
+    Args:
+        status_code: HTTP status code
+
+    Returns:
+        Mock: Mocked httpx.Response
+    """
+    if status_code >= 400:
+        return make_response(status_code, {"error": "error"}, error="error")
+    return make_response(status_code, {"id": "PROD-123"})
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Ensure each test starts without a cached access token."""
+    IvantiRepository._token_cache.clear()
+    yield
+    IvantiRepository._token_cache.clear()
+
+
 @pytest.fixture
 def mock_auth_response() -> dict:
     """Fixture for mock authentication response."""
-    return {
-        "access_token": "test-token",
-        "token_type": "Bearer",
-        "expires_in": 3600
-    }
+    return AUTH_RESPONSE
 
 
 @pytest.fixture
 def mock_auth_success(mock_httpx_client: Mock, mock_auth_response: dict) -> Mock:
     """Fixture for successful authentication."""
-    response = Mock(spec=httpx.Response)
-    response.status_code = 200
-    response.json.return_value = mock_auth_response
-    response.raise_for_status = Mock()
-    return response
-
-
-@pytest.fixture
-def ivanti_config() -> IvantiConfig:
-    """Fixture for Ivanti configuration."""
-    return IvantiConfig(
-        api_url="https://ivanti-api.example.com",
-        api_key="test-api-key",
-        client_id="test-client-id",
-        client_secret="test-client-secret",
-        token_url="https://ivanti-api.example.com/oauth/token",
-        request_timeout=30,
-        max_retries=3,
-        retry_delay=1
-    )
+    return make_response(200, mock_auth_response)
 
 
 @pytest.fixture
@@ -73,78 +181,20 @@ def ivanti_repository(
 
 
 @pytest.fixture
-def sample_product() -> Product:
-    """Fixture for sample product data."""
-    return Product(
-        product_id="PROD-123",
-        product_name="Test Product",
-        product_elements=[
-            ProductElement(
-                Lenght=50,
-                **{
-                    "Procuct Element": "Element 1",
-                    "Type": "Hardware",
-                    "GG Startup": 3,
-                    "RU": "RU1",
-                    "RU Qty": 10,
-                    "RU Unit of measure": "Days",
-                    "Q.ty min": 1,
-                    "Q.ty MAX": 100,
-                    "%Sconto MAX": Decimal("15"),
-                    "Startup Costo": Decimal("500.0"),
-                    "Startup Margine": Decimal("20"),
-                    "Startup Prezzo": Decimal("600.0"),
-                    "Canone Costo Mese": Decimal("100.0"),
-                    "Canone Margine": Decimal("10"),
-                    "Canone Prezzo Mese": Decimal("110.0"),
-                    "Extended Description": "Test Description",
-                    "Profit Center Prevalente": "PC001",
-                    "Status": "Active",
-                    "Note": "Test Note",
-                    "Object": "REF001"
-                }
-            )
-        ],
-        created_at=datetime.now(UTC)
-    )
+def batch_repository(
+    ivanti_config: IvantiConfig,
+    mock_httpx_client: Mock,
+    mock_auth_success: Mock
+) -> IvantiRepository:
+    """Fixture for Ivanti repository using the batch endpoint."""
+    mock_httpx_client.post.return_value = mock_auth_success
+    return IvantiRepository(replace(ivanti_config, use_batch_endpoint=True))
 
 
 @pytest.fixture
 def mock_product_response() -> dict:
     """Fixture for mock product response from Ivanti API."""
-    return {
-        "id": "PROD-123",
-        "name": "Test Product",
-        "elements": [
-            {
-                "id": "ELEM-001",
-                "name": "Element 1",
-                "type": "Hardware",
-                "startup_days": 3,
-                "resource_unit": "RU1",
-                "resource_unit_qty": 10,
-                "resource_unit_measure": "Days",
-                "quantity_min": 1,
-                "quantity_max": 100,
-                "max_discount_percentage": 15.0,
-                "startup_cost": 500.0,
-                "startup_margin": 20.0,
-                "startup_price": 600.0,
-                "monthly_fee_cost": 100.0,
-                "monthly_fee_margin": 10.0,
-                "monthly_fee_price": 110.0,
-                "extended_description": "Test Description",
-                "profit_center": "PC001",
-                "status": "Active",
-                "notes": "Test Note",
-                "object_reference": "REF001",
-                "length": 50
-            }
-        ],
-        "status": "Active",
-        "created_at": "2024-01-23T12:00:00Z",
-        "updated_at": "2024-01-23T12:00:00Z"
-    }
+    return PRODUCT_RESPONSE
 
 
 def test_authentication_success(
@@ -154,10 +204,7 @@ def test_authentication_success(
 ):
     """Test successful authentication."""
     # Setup
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = mock_auth_response
-    mock_response.raise_for_status = Mock()
+    mock_response = make_response(200, mock_auth_response)
     mock_httpx_client.post.return_value = mock_response
 
     # Execute
@@ -165,14 +212,14 @@ def test_authentication_success(
 
     # Verify
     assert ivanti_repository._access_token == "test-token"
-    mock_httpx_client.post.assert_called_once_with(
-        ivanti_repository.config.token_url,
-        json={
-            "client_id": "test-client-id",
-            "client_secret": "test-client-secret",
-            "grant_type": "client_credentials"
-        }
-    )
+    mock_httpx_client.post.assert_called_once()
+    auth_call = mock_httpx_client.post.call_args
+    assert auth_call[0] == (ivanti_repository.config.token_url,)
+    assert json.loads(auth_call[1]["content"]) == {
+        "client_id": "test-client-id",
+        "client_secret": "test-client-secret",
+        "grant_type": "client_credentials"
+    }
 
 
 def test_authentication_failure(
@@ -181,15 +228,10 @@ def test_authentication_failure(
 ):
     """Test authentication failure."""
     # Setup
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 401
-    mock_response.json.return_value = {"error": "Invalid credentials"}
-    mock_response.raise_for_status = Mock(
-        side_effect=httpx.HTTPStatusError(
-            "Authentication failed",
-            request=Mock(),
-            response=mock_response
-        )
+    mock_response = make_response(
+        401,
+        {"error": "Invalid credentials"},
+        error="Authentication failed"
     )
     mock_httpx_client.post.return_value = mock_response
 
@@ -200,6 +242,143 @@ def test_authentication_failure(
     assert "Authentication failed" in str(exc_info.value)
 
 
+def test_authentication_reuses_cached_token(
+    ivanti_config: IvantiConfig,
+    ivanti_repository: IvantiRepository,
+    mock_httpx_client: Mock
+):
+    """Test that a second repository reuses the cached access token."""
+    # Setup
+    ivanti_repository.connect()
+
+    # Execute
+    other_repository = IvantiRepository(ivanti_config)
+    other_repository.connect()
+
+    # Verify
+    assert other_repository._access_token == "test-token"
+    mock_httpx_client.post.assert_called_once()
+
+
+def test_authentication_reuses_token_cached_on_disk(
+    ivanti_config: IvantiConfig,
+    mock_httpx_client: Mock,
+    mock_auth_success: Mock,
+    tmp_path
+):
+    """Test that a token cached on disk is reused by a later process run."""
+    # Setup
+    config = replace(ivanti_config, token_cache_dir=str(tmp_path))
+    mock_httpx_client.post.return_value = mock_auth_success
+    IvantiRepository(config).connect()
+    IvantiRepository._token_cache.clear()  # Simulate a new process
+
+    # Execute
+    repository = IvantiRepository(config)
+    repository.connect()
+
+    # Verify
+    assert repository._access_token == "test-token"
+    mock_httpx_client.post.assert_called_once()
+
+
+def test_disk_token_cache_ignores_rotated_secret(
+    ivanti_config: IvantiConfig,
+    mock_httpx_client: Mock,
+    mock_auth_success: Mock,
+    tmp_path
+):
+    """Test that a token cached on disk is not reused with a new secret."""
+    # Setup
+    config = replace(ivanti_config, token_cache_dir=str(tmp_path))
+    mock_httpx_client.post.return_value = mock_auth_success
+    IvantiRepository(config).connect()
+    IvantiRepository._token_cache.clear()  # Simulate a new process
+
+    # Execute
+    repository = IvantiRepository(replace(config, client_secret="rotated"))
+    repository.connect()
+
+    # Verify
+    assert mock_httpx_client.post.call_count == 2
+
+
+def test_unauthorized_response_invalidates_cached_token(
+    ivanti_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    mock_auth_response: dict
+):
+    """Test that a 401 response replaces the cached access token."""
+    # Setup
+    ivanti_repository.connect()
+    mock_httpx_client.post.side_effect = [
+        make_response(200, {**mock_auth_response, "access_token": "fresh-token"})
+    ]
+    mock_response = make_response(
+        401,
+        {"message": "Token revoked"},
+        error="Unauthorized"
+    )
+    mock_httpx_client.get.return_value = mock_response
+
+    # Execute
+    with pytest.raises(IvantiAPIError):
+        ivanti_repository.get_product("PROD-123")
+
+    # Verify
+    assert ivanti_repository._access_token == "fresh-token"
+    assert [token for token, _ in IvantiRepository._token_cache.values()] == [
+        "fresh-token"
+    ]
+    assert mock_httpx_client.get.call_count == 2
+
+
+def test_unauthorized_response_reauthenticates_once(
+    ivanti_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    mock_product_response: dict
+):
+    """Test that a request rejected with 401 is resent with a fresh token."""
+    # Setup
+    unauthorized_response = make_response(401)
+
+    ok_response = make_response(200, mock_product_response)
+
+    mock_httpx_client.get.side_effect = [unauthorized_response, ok_response]
+
+    # Execute
+    product = ivanti_repository.get_product("PROD-123")
+
+    # Verify
+    assert product.product_id == "PROD-123"
+    assert mock_httpx_client.get.call_count == 2
+    assert mock_httpx_client.post.call_count == 2  # Initial and refreshed token
+
+
+def test_http_client_reused_across_calls(
+    ivanti_config: IvantiConfig,
+    mock_httpx_client: Mock,
+    mock_auth_success: Mock,
+    mock_product_response: dict,
+    mocker: MockerFixture
+):
+    """Test that a repository sends every request through one HTTP client."""
+    # Setup
+    client_class = mocker.patch("httpx.Client", return_value=mock_httpx_client)
+    mock_httpx_client.post.return_value = mock_auth_success
+    mock_httpx_client.get.return_value = make_response(200, mock_product_response)
+
+    # Execute
+    with IvantiRepository(ivanti_config) as repository:
+        repository.get_product("PROD-123")
+        repository.get_product("PROD-456")
+
+    # Verify
+    client_class.assert_called_once()
+    assert mock_httpx_client.get.call_count == 2
+    mock_httpx_client.close.assert_called_once()
+
+
 def test_get_product_success(
     ivanti_repository: IvantiRepository,
     mock_httpx_client: Mock,
@@ -207,10 +386,7 @@ def test_get_product_success(
 ):
     """Test successful product retrieval."""
     # Setup
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = mock_product_response
-    mock_response.raise_for_status = Mock()
+    mock_response = make_response(200, mock_product_response)
     mock_httpx_client.get.return_value = mock_response
 
     # Execute
@@ -235,15 +411,10 @@ def test_get_product_not_found(
 ):
     """Test product not found."""
     # Setup
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 404
-    mock_response.json.return_value = {"error": "Product not found"}
-    mock_response.raise_for_status = Mock(
-        side_effect=httpx.HTTPStatusError(
-            "Not Found",
-            request=Mock(),
-            response=mock_response
-        )
+    mock_response = make_response(
+        404,
+        {"error": "Product not found"},
+        error="Not Found"
     )
     mock_httpx_client.get.return_value = mock_response
 
@@ -262,10 +433,7 @@ def test_create_product_success(
 ):
     """Test successful product creation."""
     # Setup
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 201
-    mock_response.json.return_value = {"id": "PROD-123"}
-    mock_response.raise_for_status = Mock()
+    mock_response = make_response(201, {"id": "PROD-123"})
     mock_httpx_client.post.side_effect = [
         mock_auth_success,  # For authentication
         mock_response      # For product creation
@@ -277,9 +445,8 @@ def test_create_product_success(
     # Verify
     assert success is True
     assert mock_httpx_client.post.call_count == 2
-    create_call = mock_httpx_client.post.call_args_list[1]
-    assert create_call[1]["json"]["id"] == "PROD-123"
-    assert create_call[1]["json"]["name"] == "Test Product"
+    payload = json.loads(mock_httpx_client.post.call_args_list[1].kwargs["content"])
+    assert payload == SAMPLE_PRODUCT_PAYLOAD
 
 
 def test_update_product_success(
@@ -289,10 +456,7 @@ def test_update_product_success(
 ):
     """Test successful product update."""
     # Setup
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"id": "PROD-123"}
-    mock_response.raise_for_status = Mock()
+    mock_response = make_response(200, {"id": "PROD-123"})
     mock_httpx_client.put.return_value = mock_response
 
     # Execute
@@ -301,139 +465,290 @@ def test_update_product_success(
     # Verify
     assert success is True
     mock_httpx_client.put.assert_called_once()
-    assert mock_httpx_client.put.call_args[1]["json"]["id"] == "PROD-123"
-    assert mock_httpx_client.put.call_args[1]["json"]["name"] == "Test Product"
+    payload = json.loads(mock_httpx_client.put.call_args.kwargs["content"])
+    assert payload == SAMPLE_PRODUCT_PAYLOAD
 
 
-def test_retry_on_temporary_error(
-    ivanti_repository: IvantiRepository,
+def test_update_product_msgpack_payload(
+    ivanti_config: IvantiConfig,
     mock_httpx_client: Mock,
-    sample_product: Product
+    mock_auth_success: Mock,
+    sample_product: Product,
+    mocker: MockerFixture
 ):
-    """Test retry mechanism on temporary errors."""
-    # Setup responses: two failures followed by success
-    error_response = Mock(spec=httpx.Response)
-    error_response.status_code = 503
-    error_response.json.return_value = {"error": "Service Unavailable"}
-    error_response.raise_for_status = Mock(
-        side_effect=httpx.HTTPStatusError(
-            "Service Unavailable",
-            request=Mock(),
-            response=error_response
+    """Test that products are sent msgpack-encoded when configured."""
+    # Setup
+    mock_httpx_client.post.return_value = mock_auth_success
+    msgpack = Mock(encode=Mock(return_value=b"\x81\xa2id\xa8PROD-123"))
+    mocker.patch("deda_ingestor.repositories.ivanti_repository.msgpack", msgpack)
+    repository = IvantiRepository(
+        replace(ivanti_config, content_type="application/msgpack")
+    )
+    mock_httpx_client.put.return_value = make_response(200, {"id": "PROD-123"})
+
+    # Execute
+    success = repository.update_product(sample_product)
+
+    # Verify
+    assert success is True
+    payload = msgpack.encode.call_args.args[0]
+    assert payload["id"] == "PROD-123"
+    assert payload["name"] == "Test Product"
+    call = mock_httpx_client.put.call_args
+    assert call.kwargs["headers"] == {"Content-Type": "application/msgpack"}
+    assert call.kwargs["content"] == b"\x81\xa2id\xa8PROD-123"
+
+
+def test_unsupported_content_type_rejected(
+    ivanti_config: IvantiConfig,
+    mock_httpx_client: Mock
+):
+    """Test that an unsupported payload content type is a config error."""
+    with pytest.raises(ConfigurationError, match="Unsupported Ivanti content type"):
+        IvantiRepository(replace(ivanti_config, content_type="text/xml"))
+
+
+def test_msgpack_content_type_requires_extra(
+    ivanti_config: IvantiConfig,
+    mock_httpx_client: Mock,
+    mocker: MockerFixture
+):
+    """Test that msgpack payloads without msgspec installed are a config error."""
+    mocker.patch("deda_ingestor.repositories.ivanti_repository.msgpack", None)
+
+    with pytest.raises(ConfigurationError, match="msgspec is required"):
+        IvantiRepository(
+            replace(ivanti_config, content_type="application/msgpack")
         )
+
+
+@pytest.mark.parametrize("codes,final,calls", [
+    ([503, 503, 200], True, 3),
+    ([429, 200], True, 2),
+    ([400], False, 1),
+])
+def test_retry_behavior(
+    ivanti_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    sample_product: Product,
+    codes: list,
+    final: bool,
+    calls: int,
+    mocker: MockerFixture
+):
+    """Test retries on temporary errors and none on client errors."""
+    # Setup
+    wait = mocker.patch(
+        "deda_ingestor.utils.retry._SHUTDOWN.wait",
+        return_value=False
     )
+    mock_httpx_client.put.side_effect = [make_status_response(c) for c in codes]
+
+    # Execute
+    if final:
+        assert ivanti_repository.update_product(sample_product) is True
+    else:
+        with pytest.raises(IvantiAPIError):
+            ivanti_repository.update_product(sample_product)
+
+    # Verify
+    assert mock_httpx_client.put.call_count == calls
+    assert wait.call_count == calls - 1
 
-    success_response = Mock(spec=httpx.Response)
-    success_response.status_code = 200
-    success_response.json.return_value = {"id": "PROD-123"}
-    success_response.raise_for_status = Mock()
 
-    mock_httpx_client.put.side_effect = [
-        error_response,
-        error_response,
-        success_response
+def test_batch_process_products(
+    batch_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    sample_product: Product,
+    mock_auth_success: Mock
+):
+    """Test batch processing of products in a single request."""
+    # Setup
+    batch_response = make_response(200, {
+        "results": [
+            {"id": "PROD-1", "status": 201},
+            {"id": "PROD-2", "status": 400, "error": "Invalid data"},
+            {"id": "PROD-3", "status": 201}
+        ]
+    })
+    mock_httpx_client.post.side_effect = [mock_auth_success, batch_response]
+
+    products = [
+        sample_product.model_copy(update={"product_id": f"PROD-{i}"})
+        for i in (1, 2, 3)
     ]
 
     # Execute
-    success = ivanti_repository.update_product(sample_product)
+    result = batch_repository.batch_process_products(products, "create")
 
     # Verify
-    assert success is True
-    assert mock_httpx_client.put.call_count == 3
+    assert result.total_processed == 3
+    assert result.successful_syncs == 2
+    assert result.failed_syncs == 1
+    assert result.errors == {"PROD-2": "Error during create: Invalid data"}
+    batch_call = mock_httpx_client.post.call_args_list[1]
+    payload = json.loads(batch_call[1]["content"])
+    assert [op["product"]["id"] for op in payload["operations"]] == [
+        "PROD-1", "PROD-2", "PROD-3"
+    ]
 
 
-def test_rate_limit_handling(
-    ivanti_repository: IvantiRepository,
+@pytest.mark.parametrize("code", [404, 405, 501])
+def test_batch_process_products_falls_back_to_single_requests(
+    batch_repository: IvantiRepository,
     mock_httpx_client: Mock,
     sample_product: Product,
-    mock_auth_response: dict
+    mock_auth_success: Mock,
+    code: int
 ):
-    """Test handling of rate limit responses."""
-    # Setup rate limit response
-    rate_limit_response = Mock(spec=httpx.Response)
-    rate_limit_response.status_code = 429
-    rate_limit_response.headers = {"Retry-After": "2"}
-    rate_limit_response.json.return_value = {"error": "Rate limit exceeded"}
-    rate_limit_response.raise_for_status = Mock(
-        side_effect=httpx.HTTPStatusError(
-            "Rate limit exceeded",
-            request=Mock(),
-            response=rate_limit_response
-        )
-    )
+    """Test that products are sent one by one without a batch endpoint."""
+    # Setup
+    unsupported_response = make_status_response(code)
+    success_response = make_response(201, {"id": "PROD-123"})
+    error_response = make_response(400, {"error": "Invalid data"}, error="Bad Request")
+
+    mock_httpx_client.post.side_effect = [
+        mock_auth_success,     # Authentication
+        unsupported_response,  # Batch endpoint
+        success_response,      # First product
+        error_response,        # Second product
+        success_response       # Third product
+    ]
+
+    products = [
+        sample_product.model_copy(update={"product_id": f"PROD-{i}"})
+        for i in (1, 2, 3)
+    ]
 
-    success_response = Mock(spec=httpx.Response)
-    success_response.status_code = 200
-    success_response.json.return_value = mock_auth_response
-    success_response.raise_for_status = Mock()
+    # Execute
+    result = batch_repository.batch_process_products(products, "create")
 
-    create_response = Mock(spec=httpx.Response)
-    create_response.status_code = 201
-    create_response.json.return_value = {"id": "PROD-123"}
-    create_response.raise_for_status = Mock()
+    # Verify
+    assert result.total_processed == 3
+    assert result.successful_syncs == 2
+    assert result.failed_syncs == 1
+    assert list(result.errors) == ["PROD-2"]
+    assert batch_repository._batch_supported is False
 
+
+def test_batch_process_products_records_batch_errors(
+    batch_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    sample_product: Product,
+    mock_auth_success: Mock,
+    mocker: MockerFixture
+):
+    """Test that a failing batch request fails every product in it."""
+    # Setup
+    mocker.patch("deda_ingestor.utils.retry._SHUTDOWN.wait", return_value=False)
+    server_error = make_status_response(500)
     mock_httpx_client.post.side_effect = [
-        rate_limit_response,
-        success_response,
-        create_response
+        mock_auth_success,  # Authentication
+        server_error,       # Batch endpoint, retried until exhausted
+        server_error,
+        server_error
+    ]
+
+    products = [
+        sample_product.model_copy(update={"product_id": f"PROD-{i}"})
+        for i in (1, 2)
     ]
 
     # Execute
-    success = ivanti_repository.create_product(sample_product)
+    result = batch_repository.batch_process_products(products, "create")
 
     # Verify
-    assert success is True
-    assert mock_httpx_client.post.call_count == 3
+    assert result.total_processed == 2
+    assert result.successful_syncs == 0
+    assert result.failed_syncs == 2
+    assert list(result.errors) == ["PROD-1", "PROD-2"]
+    assert all(e.startswith("Error during create:") for e in result.errors.values())
+    assert mock_httpx_client.post.call_count == 4
+    assert batch_repository._batch_supported is True
 
 
-def test_batch_process_products(
+def test_batch_process_products_defaults_to_single_requests(
     ivanti_repository: IvantiRepository,
     mock_httpx_client: Mock,
     sample_product: Product,
-    mock_auth_response: dict
+    mock_auth_success: Mock
 ):
-    """Test batch processing of products."""
-    # Setup authentication response
-    auth_response = Mock(spec=httpx.Response)
-    auth_response.status_code = 200
-    auth_response.json.return_value = mock_auth_response
-    auth_response.raise_for_status = Mock()
-
-    # Setup success response
-    success_response = Mock(spec=httpx.Response)
-    success_response.status_code = 201
-    success_response.json.return_value = {"id": "PROD-123"}
-    success_response.raise_for_status = Mock()
-
-    # Setup error response
-    error_response = Mock(spec=httpx.Response)
-    error_response.status_code = 400
-    error_response.json.return_value = {"error": "Invalid data"}
-    error_response.raise_for_status = Mock(
-        side_effect=httpx.HTTPStatusError(
-            "Bad Request",
-            request=Mock(),
-            response=error_response
-        )
+    """Test that the batch endpoint is not used unless enabled."""
+    # Setup
+    success_response = make_response(201, {"id": "PROD-123"})
+    mock_httpx_client.post.side_effect = [
+        mock_auth_success,  # Authentication
+        success_response,   # First product
+        success_response    # Second product
+    ]
+
+    products = [
+        sample_product.model_copy(update={"product_id": f"PROD-{i}"})
+        for i in (1, 2)
+    ]
+
+    # Execute
+    result = ivanti_repository.batch_process_products(products, "create")
+
+    # Verify
+    assert result.successful_syncs == 2
+    assert all(
+        not call.args[0].endswith(":batch")
+        for call in mock_httpx_client.post.call_args_list[1:]
     )
 
-    # Set up response sequence
+
+def test_batch_process_products_rejected_batch_falls_back(
+    batch_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    sample_product: Product,
+    mock_auth_success: Mock
+):
+    """Test that a rejected batch is sent one product at a time."""
+    # Setup
+    success_response = make_response(201, {"id": "PROD-123"})
     mock_httpx_client.post.side_effect = [
-        auth_response,    # First authentication
-        success_response, # First product
-        auth_response,    # Second authentication
-        error_response,   # Second product
-        auth_response,    # Third authentication
-        success_response  # Third product
+        mock_auth_success,          # Authentication
+        make_status_response(400),  # Batch endpoint
+        success_response,           # First product
+        success_response            # Second product
     ]
 
-    products = [sample_product] * 3
+    products = [
+        sample_product.model_copy(update={"product_id": f"PROD-{i}"})
+        for i in (1, 2)
+    ]
 
     # Execute
-    result = ivanti_repository.batch_process_products(products, "create")
+    result = batch_repository.batch_process_products(products, "create")
 
     # Verify
-    assert result.total_processed == 3
     assert result.successful_syncs == 2
-    assert result.failed_syncs == 1
-    assert len(result.errors) == 1
\ No newline at end of file
+    assert result.failed_syncs == 0
+    assert mock_httpx_client.post.call_count == 4
+    assert batch_repository._batch_supported is True
+
+
+def test_get_product_not_modified_uses_cache(
+    ivanti_repository: IvantiRepository,
+    mock_httpx_client: Mock,
+    mock_product_response: dict
+):
+    """Test that unchanged products are served from the ETag cache."""
+    # Setup
+    ok_response = make_response(200, mock_product_response, headers={"ETag": '"v1"'})
+
+    not_modified_response = make_response(304)
+
+    mock_httpx_client.get.side_effect = [ok_response, not_modified_response]
+
+    # Execute
+    first = ivanti_repository.get_product("PROD-123")
+    second = ivanti_repository.get_product("PROD-123")
+
+    # Verify
+    assert second is first
+    assert mock_httpx_client.get.call_args_list[1][1]["headers"] == {
+        "If-None-Match": '"v1"'
+    }
+    not_modified_response.json.assert_not_called()
@@ -1,6 +1,7 @@
 """Tests for the ProductAdapter class."""
 from datetime import datetime
 from decimal import Decimal
+import json
 import pytest
 
 from deda_ingestor.adapters.product_adapter import ProductAdapter
@@ -8,98 +9,104 @@ from deda_ingestor.core.exceptions import AdapterError
 from deda_ingestor.core.models import Product, ProductElement, IvantiProduct
 
 
+SAMPLE_RABBITMQ_MESSAGE = {
+    "productId": "P12345",
+    "productName": "Nome di esempio del prodotto",
+    "productElements": [
+        {
+            "Lenght": 50,
+            "Procuct Element": "Elemento Prodotto 1",
+            "Type": "Hardware",
+            "GG Startup": 3,
+            "RU": "Resource Unit Esempio",
+            "RU Qty": 10,
+            "RU Unit of measure": "Giorni",
+            "Q.ty min": 1,
+            "Q.ty MAX": 100,
+            "%Sconto MAX": 15,
+            "Startup Costo": 500.0,
+            "Startup Margine": 20,
+            "Startup Prezzo": 600.0,
+            "Canone Costo Mese": 100.0,
+            "Canone Margine": 10,
+            "Canone Prezzo Mese": 110.0,
+            "Extended Description": "Descrizione estesa dell'elemento",
+            "Profit Center Prevalente": "Codice Centro di Profitto",
+            "Status": "Active",
+            "Note": "Eventuali note extra",
+            "Object": "Riferimento oggetto"
+        },
+        {
+            "Lenght": 75,
+            "Procuct Element": "Elemento Prodotto 2",
+            "Type": "Software",
+            "GG Startup": 5,
+            "RU": "Altro Resource Unit",
+            "RU Qty": 20,
+            "RU Unit of measure": "Unità",
+            "Q.ty min": 1,
+            "Q.ty MAX": 50,
+            "%Sconto MAX": 10,
+            "Startup Costo": 750.0,
+            "Startup Margine": 15,
+            "Startup Prezzo": 862.5,
+            "Canone Costo Mese": 200.0,
+            "Canone Margine": 20,
+            "Canone Prezzo Mese": 240.0,
+            "Extended Description": "Ulteriore descrizione estesa",
+            "Profit Center Prevalente": "Altro Centro di Profitto",
+            "Status": "Active",
+            "Note": "Note su questo elemento",
+            "Object": "ID o riferimento specifico"
+        }
+    ]
+}
+
+
+SAMPLE_IVANTI_RESPONSE = {
+    "id": "P12345",
+    "name": "Nome di esempio del prodotto",
+    "elements": [
+        {
+            "id": "elem-001",
+            "name": "Elemento Prodotto 1",
+            "type": "Hardware",
+            "startup_days": 3,
+            "resource_unit": "Resource Unit Esempio",
+            "resource_unit_qty": 10,
+            "resource_unit_measure": "Giorni",
+            "quantity_min": 1,
+            "quantity_max": 100,
+            "max_discount_percentage": 15.0,
+            "startup_cost": 500.0,
+            "startup_margin": 20.0,
+            "startup_price": 600.0,
+            "monthly_fee_cost": 100.0,
+            "monthly_fee_margin": 10.0,
+            "monthly_fee_price": 110.0,
+            "extended_description": "Descrizione estesa dell'elemento",
+            "profit_center": "Codice Centro di Profitto",
+            "status": "Active",
+            "notes": "Eventuali note extra",
+            "object_reference": "Riferimento oggetto"
+        }
+    ],
+    "status": "Active",
+    "created_at": "2024-01-23T12:00:00Z",
+    "updated_at": "2024-01-23T12:00:00Z"
+}
+
+
 @pytest.fixture
 def sample_rabbitmq_message():
     """Sample RabbitMQ message fixture."""
-    return {
-        "productId": "P12345",
-        "productName": "Nome di esempio del prodotto",
-        "productElements": [
-            {
-                "Lenght": 50,
-                "Procuct Element": "Elemento Prodotto 1",
-                "Type": "Hardware",
-                "GG Startup": 3,
-                "RU": "Resource Unit Esempio",
-                "RU Qty": 10,
-                "RU Unit of measure": "Giorni",
-                "Q.ty min": 1,
-                "Q.ty MAX": 100,
-                "%Sconto MAX": 15,
-                "Startup Costo": 500.0,
-                "Startup Margine": 20,
-                "Startup Prezzo": 600.0,
-                "Canone Costo Mese": 100.0,
-                "Canone Margine": 10,
-                "Canone Prezzo Mese": 110.0,
-                "Extended Description": "Descrizione estesa dell'elemento",
-                "Profit Center Prevalente": "Codice Centro di Profitto",
-                "Status": "Active",
-                "Note": "Eventuali note extra",
-                "Object": "Riferimento oggetto"
-            },
-            {
-                "Lenght": 75,
-                "Procuct Element": "Elemento Prodotto 2",
-                "Type": "Software",
-                "GG Startup": 5,
-                "RU": "Altro Resource Unit",
-                "RU Qty": 20,
-                "RU Unit of measure": "Unità",
-                "Q.ty min": 1,
-                "Q.ty MAX": 50,
-                "%Sconto MAX": 10,
-                "Startup Costo": 750.0,
-                "Startup Margine": 15,
-                "Startup Prezzo": 862.5,
-                "Canone Costo Mese": 200.0,
-                "Canone Margine": 20,
-                "Canone Prezzo Mese": 240.0,
-                "Extended Description": "Ulteriore descrizione estesa",
-                "Profit Center Prevalente": "Altro Centro di Profitto",
-                "Status": "Active",
-                "Note": "Note su questo elemento",
-                "Object": "ID o riferimento specifico"
-            }
-        ]
-    }
+    return SAMPLE_RABBITMQ_MESSAGE
 
 
 @pytest.fixture
 def sample_ivanti_response():
     """Sample Ivanti API response fixture."""
-    return {
-        "id": "P12345",
-        "name": "Nome di esempio del prodotto",
-        "elements": [
-            {
-                "id": "elem-001",
-                "name": "Elemento Prodotto 1",
-                "type": "Hardware",
-                "startup_days": 3,
-                "resource_unit": "Resource Unit Esempio",
-                "resource_unit_qty": 10,
-                "resource_unit_measure": "Giorni",
-                "quantity_min": 1,
-                "quantity_max": 100,
-                "max_discount_percentage": 15.0,
-                "startup_cost": 500.0,
-                "startup_margin": 20.0,
-                "startup_price": 600.0,
-                "monthly_fee_cost": 100.0,
-                "monthly_fee_margin": 10.0,
-                "monthly_fee_price": 110.0,
-                "extended_description": "Descrizione estesa dell'elemento",
-                "profit_center": "Codice Centro di Profitto",
-                "status": "Active",
-                "notes": "Eventuali note extra",
-                "object_reference": "Riferimento oggetto"
-            }
-        ],
-        "status": "Active",
-        "created_at": "2024-01-23T12:00:00Z",
-        "updated_at": "2024-01-23T12:00:00Z"
-    }
+    return SAMPLE_IVANTI_RESPONSE
 
 
 def test_from_rabbitmq_message(sample_rabbitmq_message):
@@ -228,6 +235,26 @@ def test_from_rabbitmq_message_missing_required_fields():
     assert "productName" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(
+    "field",
+    ProductAdapter.REQUIRED_PRODUCT_FIELDS
+)
+def test_from_rabbitmq_message_missing_required_field(
+    sample_rabbitmq_message,
+    field
+):
+    """Test that each required field is checked before validation."""
+    # Given
+    message = {k: v for k, v in sample_rabbitmq_message.items() if k != field}
+
+    # When/Then
+    with pytest.raises(AdapterError) as exc_info:
+        ProductAdapter.from_rabbitmq_message(message)
+
+    assert "Missing required fields" in str(exc_info.value)
+    assert field in str(exc_info.value)
+
+
 def test_from_rabbitmq_message_invalid_element_data():
     """Test handling of invalid element data in RabbitMQ message."""
     # Given
@@ -255,4 +282,68 @@ def test_from_rabbitmq_message_invalid_element_data():
     with pytest.raises(AdapterError) as exc_info:
         ProductAdapter.from_rabbitmq_message(message_with_invalid_element)
     
-    assert "Invalid product element" in str(exc_info.value)
\ No newline at end of file
+    assert "Invalid product element" in str(exc_info.value)
+
+
+def test_from_rabbitmq_message_bytes(sample_rabbitmq_message):
+    """Test conversion from an undecoded RabbitMQ message to Product."""
+    # Given
+    body = json.dumps(sample_rabbitmq_message).encode()
+
+    # When
+    product = ProductAdapter.from_rabbitmq_message(body)
+
+    # Then
+    assert product.product_id == "P12345"
+    assert len(product.product_elements) == 2
+    assert product.product_elements[0].startup_cost == Decimal("500.0")
+
+
+def test_from_rabbitmq_body(sample_rabbitmq_message):
+    """Test conversion of a raw RabbitMQ message body to Product model."""
+    # Given
+    body = json.dumps(sample_rabbitmq_message).encode()
+
+    # When
+    product = ProductAdapter.from_rabbitmq_body(body)
+
+    # Then
+    expected = ProductAdapter.from_rabbitmq_message(sample_rabbitmq_message)
+    assert product.product_id == expected.product_id
+    assert product.product_name == expected.product_name
+    assert product.product_elements == expected.product_elements
+
+
+def test_from_rabbitmq_body_invalid_json():
+    """Test handling of a malformed RabbitMQ message body."""
+    # When/Then
+    with pytest.raises(AdapterError) as exc_info:
+        ProductAdapter.from_rabbitmq_body(b'{"productId": ')
+
+    assert "Invalid product message" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [("RU", ""), ("Profit Center Prevalente", "  ")]
+)
+def test_entry_points_reject_empty_element_fields(
+    sample_rabbitmq_message,
+    field,
+    value
+):
+    """Test that both entry points reject the same empty element field."""
+    # Given
+    element = {**sample_rabbitmq_message["productElements"][0], field: value}
+    message = {**sample_rabbitmq_message, "productElements": [element]}
+    body = json.dumps(message).encode()
+
+    # When/Then
+    with pytest.raises(AdapterError) as message_error:
+        ProductAdapter.from_rabbitmq_message(message)
+    with pytest.raises(AdapterError) as body_error:
+        ProductAdapter.from_rabbitmq_body(body)
+
+    for error in (message_error, body_error):
+        assert "Invalid product element at index 0" in str(error.value)
+    assert body_error.value.details["validation_errors"]["empty_fields"] == [field]
@@ -0,0 +1,102 @@
+"""Tests for the ProductService class."""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from .test_product_adapter import SAMPLE_RABBITMQ_MESSAGE
+
+# The service needs the message queue and product repository interfaces
+product_service_module = pytest.importorskip(
+    "deda_ingestor.core.product_service",
+    exc_type=ImportError
+)
+ProductService = product_service_module.ProductService
+
+
+def make_body(product_id: str, product_name: str) -> bytes:
+    """
+    Build a raw RabbitMQ message body for a product.
+
+    Args:
+        product_id: Product identifier
+        product_name: Product name
+
+    Returns:
+        bytes: JSON message body
+    """
+    return json.dumps({
+        **SAMPLE_RABBITMQ_MESSAGE,
+        "productId": product_id,
+        "productName": product_name
+    }).encode()
+
+
+@pytest.fixture
+def product_repository() -> Mock:
+    """Fixture for a product repository that remembers created products."""
+    repository = Mock()
+    created = {}
+    lock = threading.Lock()
+
+    def get_product(product_id):
+        with lock:
+            return created.get(product_id)
+
+    def create_product(product):
+        # Widen the window between the lookup and the write
+        time.sleep(0.05)
+        with lock:
+            if product.product_id in created:
+                return False
+            created[product.product_id] = product
+        return True
+
+    repository.get_product.side_effect = get_product
+    repository.create_product.side_effect = create_product
+    repository.update_product.return_value = True
+    return repository
+
+
+@pytest.fixture
+def product_service(product_repository: Mock) -> ProductService:
+    """Fixture for a product service with a mocked message queue."""
+    return ProductService(
+        message_queue=Mock(),
+        product_repository=product_repository,
+        max_workers=4
+    )
+
+
+def test_process_batch_orders_messages_per_product(
+    product_service: ProductService,
+    product_repository: Mock
+):
+    """Test that messages for one product in a batch run in delivery order."""
+    # Setup
+    batch = [
+        (make_body("P1", "First"), 1),
+        (make_body("P2", "Other"), 2),
+        (make_body("P1", "Second"), 3),
+    ]
+
+    # Execute
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        product_service._process_batch(batch, executor)
+
+    # Verify
+    created = [
+        call.args[0].product_name
+        for call in product_repository.create_product.call_args_list
+    ]
+    assert sorted(created) == ["First", "Other"]
+    product_repository.update_product.assert_called_once()
+    assert product_repository.update_product.call_args.args[0].product_name == "Second"
+
+    queue = product_service.message_queue
+    assert [c.args[0] for c in queue.acknowledge_message.call_args_list] == [1, 2, 3]
+    queue.reject_message.assert_not_called()
+    assert product_service.sync_result.successful_syncs == 3
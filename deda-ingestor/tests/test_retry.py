@@ -0,0 +1,106 @@
+"""Tests for the retry decorators."""
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from deda_ingestor.core.exceptions import RetryableError
+from deda_ingestor.utils.retry import (
+    RetryConfig,
+    cancel_retries,
+    reset_retries,
+    retry_async_with_backoff,
+    retry_with_backoff
+)
+
+# Long enough that a test only finishes in time if the wait is cut short
+SLOW_RETRIES = RetryConfig(max_attempts=3, base_delay=30.0, jitter=False)
+FAST_RETRIES = RetryConfig(max_attempts=3, base_delay=0.01, jitter=False)
+
+
+@pytest.fixture(autouse=True)
+def retries_enabled():
+    """Re-enable retries cancelled by a test."""
+    reset_retries()
+    yield
+    reset_retries()
+
+
+def test_cancel_retries_wakes_pending_retry():
+    """Test that cancel_retries() abandons a retry waiting on its backoff."""
+    # Setup
+    operation = Mock(side_effect=RetryableError("unavailable"))
+
+    @retry_with_backoff(config=SLOW_RETRIES)
+    def retried():
+        return operation()
+
+    errors = []
+
+    def run():
+        try:
+            retried()
+        except RetryableError as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    time.sleep(0.1)
+
+    # Execute
+    start = time.monotonic()
+    cancel_retries()
+    worker.join(timeout=5)
+
+    # Verify
+    assert not worker.is_alive()
+    assert time.monotonic() - start < 5
+    assert len(errors) == 1
+    assert operation.call_count == 1
+
+
+async def test_cancel_retries_wakes_pending_async_retry():
+    """Test that cancel_retries() abandons an async retry on its backoff."""
+    # Setup
+    operation = Mock(side_effect=RetryableError("unavailable"))
+
+    @retry_async_with_backoff(config=SLOW_RETRIES)
+    async def retried():
+        return operation()
+
+    task = asyncio.ensure_future(retried())
+    await asyncio.sleep(0.1)
+
+    # Execute
+    threading.Thread(target=cancel_retries).start()
+
+    # Verify
+    with pytest.raises(RetryableError):
+        await asyncio.wait_for(task, timeout=5)
+    assert operation.call_count == 1
+
+
+def test_reset_retries_after_cancel():
+    """Test that retries resume once reset after a cancellation."""
+    # Setup
+    operation = Mock(side_effect=[
+        RetryableError("unavailable"),
+        RetryableError("unavailable"),
+        "ok"
+    ])
+
+    @retry_with_backoff(config=FAST_RETRIES)
+    def retried():
+        return operation()
+
+    cancel_retries()
+
+    # Execute
+    reset_retries()
+    result = retried()
+
+    # Verify
+    assert result == "ok"
+    assert operation.call_count == 3
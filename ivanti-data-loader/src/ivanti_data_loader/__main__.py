@@ -3,10 +3,8 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import NoReturn
 
 from .core.exceptions import DataLoaderError
-from .core.pipeline import Pipeline
 from .utils.logging import get_logger
 
 logger = get_logger()
@@ -37,19 +35,23 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> NoReturn:
+def main() -> int:
     """
     Main application entry point.
 
-    This function will never return normally, it will always exit
-    via sys.exit() with an appropriate status code.
+    Returns:
+        int: Process exit status, 0 if every record was loaded
     """
     try:
         # Parse arguments
         args = parse_args()
 
-        # Set log level
-        logging.getLogger().setLevel(args.log_level)
+        # Configure the root logger once, before anything logs
+        logging.basicConfig(level=args.log_level)
+
+        # Imported only once arguments are parsed; the pipeline pulls in
+        # pydantic and yaml, which --help and usage errors don't need
+        from .core.pipeline import Pipeline
 
         # Create and execute pipeline
         logger.info(f"Loading configuration from {args.config}")
@@ -64,14 +66,14 @@ def main() -> NoReturn:
                 failed=result.failed_loads,
                 success_rate=f"{result.success_rate:.2f}%"
             )
-            sys.exit(1)
+            return 1
         else:
             logger.info(
                 "Pipeline completed successfully",
                 total_records=result.total_records,
                 success_rate=f"{result.success_rate:.2f}%"
             )
-            sys.exit(0)
+            return 0
 
     except DataLoaderError as e:
         logger.error(
@@ -79,11 +81,11 @@ def main() -> NoReturn:
             error=str(e),
             details=e.details
         )
-        sys.exit(1)
-    except Exception as e:
+        return 1
+    except Exception:
         logger.exception("Unexpected error occurred")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
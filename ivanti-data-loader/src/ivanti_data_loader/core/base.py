@@ -1,10 +1,15 @@
 """Base classes for the data loader framework."""
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class DataSourceConfig(BaseModel):
     """Configuration for a data source."""
@@ -62,6 +67,15 @@ class DataTransformer(ABC, Generic[T, U]):
         """Transform data from source format to target format."""
         pass
 
+    def transform_dataframe(self, df: "pd.DataFrame") -> Optional["pd.DataFrame"]:
+        """
+        Transform a whole DataFrame of source rows at once.
+
+        Transformers that can't, or can't for this particular frame, return
+        None and the rows are transformed one by one.
+        """
+        return None
+
 
 class DataLoader(ABC, Generic[U]):
     """Abstract base class for data loaders."""
@@ -75,16 +89,28 @@ class DataLoader(ABC, Generic[U]):
         """Load data into the target system."""
         pass
 
+    def load_many(self, data: List[U]) -> List[bool]:
+        """Load a batch of data into the target system, one item at a time."""
+        return [self.load(item) for item in data]
+
 
-class LoadResult(BaseModel):
-    """Result of a data load operation."""
+@dataclass
+class LoadResult:
+    """Result of a data load operation, updated once per record."""
     total_records: int = 0
     successful_loads: int = 0
     failed_loads: int = 0
     skipped_loads: int = 0
-    errors: Dict[str, str] = Field(default_factory=dict)
-    start_time: datetime = Field(default_factory=datetime.now)
+    errors: Dict[str, str] = field(default_factory=dict)
+    start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
+    # Monotonic clock readings, immune to wall-clock adjustments
+    _start_ns: int = field(
+        default_factory=time.monotonic_ns,
+        init=False,
+        repr=False
+    )
+    _end_ns: Optional[int] = field(default=None, init=False, repr=False)
 
     def record_success(self) -> None:
         """Record a successful load."""
@@ -104,18 +130,38 @@ class LoadResult(BaseModel):
 
     def complete(self) -> None:
         """Mark the load operation as complete."""
+        self._end_ns = time.monotonic_ns()
         self.end_time = datetime.now()
 
     @property
     def duration_seconds(self) -> float:
         """Get the duration of the load operation in seconds."""
-        if not self.end_time:
+        if self._end_ns is None:
             return 0
-        return (self.end_time - self.start_time).total_seconds()
+        return (self._end_ns - self._start_ns) / 1e9
 
     @property
     def success_rate(self) -> float:
         """Get the success rate as a percentage."""
         if self.total_records == 0:
             return 0
-        return (self.successful_loads / self.total_records) * 100
\ No newline at end of file
+        return (self.successful_loads / self.total_records) * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the result as a dictionary, e.g. for logging.
+
+        Returns:
+            Dict[str, Any]: Counters, errors, timestamps and derived metrics
+        """
+        return {
+            "total_records": self.total_records,
+            "successful_loads": self.successful_loads,
+            "failed_loads": self.failed_loads,
+            "skipped_loads": self.skipped_loads,
+            "errors": dict(self.errors),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_seconds": self.duration_seconds,
+            "success_rate": self.success_rate
+        }
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Data loading pipeline orchestrator."""
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Type
 
 import yaml
 from pydantic import BaseModel
@@ -20,6 +22,46 @@ from ..utils.logging import get_logger
 
 logger = get_logger()
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Records per load_many() call when the target sets no batch_size
+_DEFAULT_BATCH_SIZE = 50
+
+# Batches submitted for loading while the following ones are read and
+# transformed; bounds memory to this many batches plus the one being built
+_MAX_BATCHES_IN_FLIGHT = 2
+
+# Row number and transformed data of each record in a batch
+_PendingBatch = List[Tuple[Any, Dict[str, Any]]]
+
+# Parsed configuration files: resolved path -> (mtime_ns, size, data)
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Any]] = {}
+
+
+def _read_config_file(config_path: Path) -> Any:
+    """
+    Parse a YAML configuration file, reusing the result until it changes.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Any: Parsed YAML document
+    """
+    path = config_path.resolve()
+    stat = path.stat()
+    cached = _CONFIG_CACHE.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(path, 'r') as f:
+        config_data = yaml.load(f, Loader=_YamlLoader)
+    _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, config_data)
+    return config_data
+
 
 class Pipeline:
     """Data loading pipeline orchestrator."""
@@ -69,9 +111,7 @@ class Pipeline:
             PipelineError: If configuration loading fails
         """
         try:
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-            return LoaderConfig(**config_data)
+            return LoaderConfig(**_read_config_file(Path(config_path)))
 
         except Exception as e:
             raise PipelineError(
@@ -135,30 +175,103 @@ class Pipeline:
                 f"Failed to create loader: {str(e)}"
             ) from e
 
-    def _process_record(self, record: Dict[str, Any]) -> bool:
+    def _transform_batch(self, records: List[Any]) -> _PendingBatch:
         """
-        Process a single record through the pipeline.
+        Transform a batch of records, recording the ones that fail.
 
         Args:
-            record: Record to process
+            records: Source records to process
 
         Returns:
-            bool: True if successful
+            _PendingBatch: Records transformed successfully
         """
-        try:
-            # Transform record
-            transformed_data = self._transformer.transform(record)
+        pending = []
+        transform = self._transformer.transform
+        for record in records:
+            try:
+                pending.append((record.row_number, transform(record.data)))
+            except Exception as e:
+                logger.error(
+                    "Record processing failed",
+                    error=str(e),
+                    record=record.data
+                )
+                self._result.record_failure(str(record.row_number), str(e))
+
+        return pending
+
+    def _load_batches(self, batches: Iterable[_PendingBatch]) -> None:
+        """
+        Load batches of transformed records on a background thread.
 
-            # Load transformed data
-            return self._loader.load(transformed_data)
+        Each batch is loaded in a single call while the following batches
+        are read and transformed, with at most _MAX_BATCHES_IN_FLIGHT
+        batches waiting. Results are recorded in order, on this thread.
 
+        Args:
+            batches: Row number and transformed data of each record, by batch
+        """
+        in_flight: Deque[Tuple[_PendingBatch, Future]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="pipeline-loader"
+        ) as executor:
+            for pending in batches:
+                if not pending:
+                    continue
+                in_flight.append((
+                    pending,
+                    executor.submit(
+                        self._loader.load_many,
+                        [data for _, data in pending]
+                    )
+                ))
+                if len(in_flight) > _MAX_BATCHES_IN_FLIGHT:
+                    self._record_batch(*in_flight.popleft())
+
+            while in_flight:
+                self._record_batch(*in_flight.popleft())
+
+    def _record_batch(self, pending: _PendingBatch, loading: Future) -> None:
+        """
+        Record the results of loading a batch.
+
+        Args:
+            pending: Row number and transformed data of each record
+            loading: Future of the batch's load_many() call
+        """
+        try:
+            results = loading.result()
         except Exception as e:
             logger.error(
-                "Record processing failed",
+                "Batch load failed",
                 error=str(e),
-                record=record
+                records=len(pending)
             )
-            return False
+            for row_number, _ in pending:
+                self._result.record_failure(str(row_number), str(e))
+            return
+
+        for (row_number, _), loaded in zip(pending, results):
+            if loaded:
+                self._result.record_success()
+            else:
+                self._result.record_failure(
+                    str(row_number),
+                    "Processing failed"
+                )
+
+    def _transforms_dataframes(self) -> bool:
+        """
+        Check whether the transformer implements transform_dataframe().
+
+        Returns:
+            bool: True if whole DataFrames may be transformed at once
+        """
+        return (
+            type(self._transformer).transform_dataframe
+            is not DataTransformer.transform_dataframe
+        )
 
     def execute(self) -> LoadResult:
         """
@@ -177,26 +290,39 @@ class Pipeline:
                 source_name=self.config.source.name
             )
 
-            # Read source data
-            records = self._reader.read()
-            logger.info(f"Read {len(records)} records from source")
-
-            # Process records
-            for record in records:
-                try:
-                    if self._process_record(record.data):
-                        self._result.record_success()
-                    else:
-                        self._result.record_failure(
-                            str(record.row_number),
-                            "Processing failed"
-                        )
-
-                except Exception as e:
-                    self._result.record_failure(
-                        str(record.row_number),
-                        str(e)
-                    )
+            # Read source data, transforming it as a whole DataFrame when
+            # both the reader and the transformer support it
+            transformed = None
+            read_dataframe = getattr(self._reader, "read_dataframe", None)
+            if read_dataframe is not None and self._transforms_dataframes():
+                frame = read_dataframe()
+                transformed = self._transformer.transform_dataframe(frame)
+                if transformed is None:
+                    records = self._reader.records_from_dataframe(frame)
+                logger.info(f"Read {len(frame)} records from source")
+            else:
+                records = self._reader.read()
+                logger.info(f"Read {len(records)} records from source")
+
+            # Process records in loader-sized batches
+            batch_size = self.config.target.get(
+                "batch_size",
+                _DEFAULT_BATCH_SIZE
+            )
+            if transformed is not None:
+                pending = list(zip(
+                    transformed.index,
+                    transformed.to_dict(orient="records")
+                ))
+                self._load_batches(
+                    pending[start:start + batch_size]
+                    for start in range(0, len(pending), batch_size)
+                )
+            else:
+                self._load_batches(
+                    self._transform_batch(records[start:start + batch_size])
+                    for start in range(0, len(records), batch_size)
+                )
 
             # Complete operation
             self._result.complete()
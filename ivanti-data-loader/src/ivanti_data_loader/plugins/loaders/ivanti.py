@@ -1,14 +1,109 @@
 """Ivanti loader plugin."""
-from datetime import datetime, UTC
-from typing import Any, Dict, List, Optional
+import base64
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field, SecretStr
 
 from ...core.base import DataLoader
 from ...core.exceptions import LoaderError
 from ..registry import PluginRegistry
 
+# Status codes meaning the API has no bulk endpoint
+_BULK_UNSUPPORTED_CODES = (404, 405, 501)
+
+# Status codes of a failed request worth retrying; on 401 the token is
+# renewed first
+_RETRYABLE_CODES = (401, 408, 429, 500, 502, 503, 504)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# numpy scalars are encoded natively; naive datetimes stay naive, like the
+# pandas timestamps handled by _json_default()
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Status codes of an update-only PUT for an entity that does not exist
+_ENTITY_MISSING_CODES = (404, 412)
+
+# Token lifetime assumed when the token carries no expiry claim
+_DEFAULT_TOKEN_TTL = timedelta(hours=1)
+
+# Tokens shared by every loader in the process, keyed by
+# (url, username, tenant): key -> (token, expiry)
+_TOKEN_CACHE: Dict[Tuple[str, str, Optional[str]], Tuple[str, datetime]] = {}
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Encode values orjson does not support natively.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Any: JSON-compatible value; ISO-8601 for pandas timestamps and
+            other datetime subclasses, str otherwise
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_json(data: Any) -> bytes:
+    """
+    Serialize a request body with orjson.
+
+    Args:
+        data: Request body
+
+    Returns:
+        bytes: JSON-encoded body
+    """
+    return orjson.dumps(data, default=_json_default, option=_JSON_OPTIONS)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """
+    Get the HTTP status code behind a failed request.
+
+    Args:
+        error: Error raised for the request
+
+    Returns:
+        Optional[int]: Status code of the response, or None if there was no
+            error response
+    """
+    cause = error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code
+    return None
+
+
+def _token_expiry(token: str) -> datetime:
+    """
+    Get the expiry of a token from its JWT "exp" claim.
+
+    Args:
+        token: Authentication token
+
+    Returns:
+        datetime: Token expiry, one hour from now if the token is not a
+            JWT with an "exp" claim
+    """
+    try:
+        payload = token.split(".")[1]
+        # JWT segments are unpadded base64url
+        padded = payload + "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromtimestamp(claims["exp"], timezone.utc)
+    except Exception:
+        return datetime.now(timezone.utc).replace(microsecond=0) + _DEFAULT_TOKEN_TTL
+
 
 class IvantiAuth(BaseModel):
     """Ivanti authentication configuration."""
@@ -34,6 +129,20 @@ class IvantiLoaderConfig(BaseModel):
         default=3,
         description="Number of retry attempts for failed requests"
     )
+    max_concurrency: int = Field(
+        default=16,
+        description="Maximum number of records loaded concurrently"
+    )
+    use_upsert: bool = Field(
+        default=False,
+        description="Write records with PUT, creating missing ones, "
+                    "instead of checking existence first"
+    )
+    use_bulk: bool = Field(
+        default=False,
+        description="Send each batch as one request to the "
+                    "/api/<entity_type>/_bulk endpoint, if the API has one"
+    )
 
 
 @PluginRegistry.register_loader("ivanti")
@@ -50,15 +159,70 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
         super().__init__(config)
         self.auth_token: Optional[str] = None
         self.auth_expiry: Optional[datetime] = None
+        # Cleared once the API turns out not to support bulk loads
+        self._bulk_supported = config.use_bulk
+        self._auth_lock = threading.Lock()
+        self._token_cache_key = (
+            config.auth.url,
+            config.auth.username,
+            config.auth.tenant
+        )
+        # One pooled HTTP/2 connection serves the concurrent requests
         self._client = httpx.Client(
             base_url=config.auth.url,
             timeout=config.timeout,
-            verify=True  # SSL verification
+            verify=True,  # SSL verification
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=2 * config.max_concurrency,
+                max_keepalive_connections=config.max_concurrency
+            )
         )
 
-    def _authenticate(self) -> None:
+    def _invalidate_token(self, token: Optional[str]) -> None:
+        """
+        Drop an authentication token the API rejected.
+
+        The token is only dropped if no other thread has replaced it yet,
+        so concurrent rejections lead to a single new token.
+
+        Args:
+            token: Rejected token
+        """
+        with self._auth_lock:
+            if self.auth_token == token:
+                self.auth_token = None
+                self.auth_expiry = None
+            cached = _TOKEN_CACHE.get(self._token_cache_key)
+            if cached and cached[0] == token:
+                del _TOKEN_CACHE[self._token_cache_key]
+
+    def _prepare_retry(self, error: LoaderError, token: Optional[str]) -> bool:
+        """
+        Check whether a failed request is worth retrying.
+
+        Connection errors and the status codes in _RETRYABLE_CODES are
+        retried; on a 401 the rejected token is renewed first. Other errors,
+        such as a 4xx for bad data, are not.
+
+        Args:
+            error: Error raised by the request
+            token: Token the request was sent with
+
+        Returns:
+            bool: True if the request should be retried
         """
-        Authenticate with Ivanti API.
+        status_code = _status_code(error)
+        if status_code is None:
+            return isinstance(error.__cause__, httpx.TransportError)
+        if status_code == 401:
+            self._invalidate_token(token)
+            self._ensure_authenticated()
+        return status_code in _RETRYABLE_CODES
+
+    def _request_token(self) -> None:
+        """
+        Request a new authentication token.
 
         Raises:
             LoaderError: If authentication fails
@@ -75,27 +239,52 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
             response.raise_for_status()
             
             data = response.json()
-            self.auth_token = data["token"]
-            # Set token expiry (typically 1 hour from now)
-            self.auth_expiry = datetime.now(UTC).replace(
-                microsecond=0
-            ) + datetime.timedelta(hours=1)
-            
-            self._client.headers.update({
-                "Authorization": f"Bearer {self.auth_token}"
-            })
+            token = data["token"]
+            expiry = _token_expiry(token)
 
         except Exception as e:
             raise LoaderError(f"Authentication failed: {str(e)}") from e
 
+        _TOKEN_CACHE[self._token_cache_key] = (token, expiry)
+        self._set_token(token, expiry)
+
+    def _set_token(self, token: str, expiry: datetime) -> None:
+        """
+        Use an authentication token for subsequent requests.
+
+        Args:
+            token: Authentication token
+            expiry: Token expiry
+        """
+        self.auth_token = token
+        self.auth_expiry = expiry
+        self._client.headers.update({
+            "Authorization": f"Bearer {token}"
+        })
+
+    def _token_valid(self) -> bool:
+        """Check whether the current authentication token is still valid."""
+        return bool(
+            self.auth_token and
+            self.auth_expiry and
+            datetime.now(timezone.utc) < self.auth_expiry
+        )
+
     def _ensure_authenticated(self) -> None:
         """Ensure valid authentication token exists."""
-        if (
-            not self.auth_token or
-            not self.auth_expiry or
-            datetime.now(UTC) >= self.auth_expiry
-        ):
-            self._authenticate()
+        if not self._token_valid():
+            # Concurrent loads share a single authentication round-trip
+            with self._auth_lock:
+                if self._token_valid():
+                    return
+
+                # Reuse a token obtained by another loader for the same
+                # account
+                cached = _TOKEN_CACHE.get(self._token_cache_key)
+                if cached and datetime.now(timezone.utc) < cached[1]:
+                    self._set_token(*cached)
+                else:
+                    self._request_token()
 
     def _create_entity(self, data: Dict[str, Any]) -> bool:
         """
@@ -113,7 +302,8 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
         try:
             response = self._client.post(
                 f"/api/{self.config.entity_type}",
-                json=data
+                content=_encode_json(data),
+                headers=_JSON_HEADERS
             )
             response.raise_for_status()
             return True
@@ -140,7 +330,8 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
         try:
             response = self._client.put(
                 f"/api/{self.config.entity_type}/{entity_id}",
-                json=data
+                content=_encode_json(data),
+                headers=_JSON_HEADERS
             )
             response.raise_for_status()
             return True
@@ -150,6 +341,69 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
                 f"Failed to update {self.config.entity_type} {entity_id}: {str(e)}"
             ) from e
 
+    def _upsert_entity(self, entity_id: str, data: Dict[str, Any]) -> bool:
+        """
+        Update entity in Ivanti, creating it if it does not exist.
+
+        Existing entities take a single request; only new ones need a
+        second.
+
+        Args:
+            entity_id: ID of entity to write
+            data: Entity data
+
+        Returns:
+            bool: True if successful
+
+        Raises:
+            LoaderError: If the write fails
+        """
+        try:
+            # Update-only write: the API answers 404 (or 412, failing the
+            # precondition) instead of creating the entity
+            response = self._client.put(
+                f"/api/{self.config.entity_type}/{entity_id}",
+                content=_encode_json(data),
+                headers={**_JSON_HEADERS, "If-Match": "*"}
+            )
+            if response.status_code in _ENTITY_MISSING_CODES:
+                return self._create_entity(data)
+            response.raise_for_status()
+            return True
+
+        except LoaderError:
+            raise
+        except Exception as e:
+            raise LoaderError(
+                f"Failed to upsert {self.config.entity_type} {entity_id}: {str(e)}"
+            ) from e
+
+    def _exists_many(self, entity_ids: List[str]) -> Set[str]:
+        """
+        Check which entities exist in Ivanti with a single request.
+
+        Args:
+            entity_ids: IDs of entities to check
+
+        Returns:
+            Set[str]: IDs of the entities that exist
+
+        Raises:
+            LoaderError: If check fails
+        """
+        try:
+            response = self._client.get(
+                f"/api/{self.config.entity_type}/exists",
+                params={"ids": ",".join(entity_ids)}
+            )
+            response.raise_for_status()
+            return set(response.json())
+
+        except Exception as e:
+            raise LoaderError(
+                f"Failed to check {self.config.entity_type} existence: {str(e)}"
+            ) from e
+
     def _entity_exists(self, entity_id: str) -> bool:
         """
         Check if entity exists in Ivanti.
@@ -184,6 +438,23 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
         Returns:
             bool: True if successful
 
+        Raises:
+            LoaderError: If load fails
+        """
+        return self._load(data)
+
+    def _load(self, data: Dict[str, Any], exists: Optional[bool] = None) -> bool:
+        """
+        Load data into Ivanti.
+
+        Args:
+            data: Data to load
+            exists: Whether the entity is known to exist; checked with the
+                API when unknown and upserts are disabled
+
+        Returns:
+            bool: True if successful
+
         Raises:
             LoaderError: If load fails
         """
@@ -194,21 +465,26 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
             if not entity_id:
                 raise LoaderError("Data missing required 'id' field")
 
-            # Determine if entity exists
-            exists = self._entity_exists(entity_id)
+            # Determine if entity exists; upserts need no check
+            if exists is None and not self.config.use_upsert:
+                exists = self._entity_exists(entity_id)
 
             # Create or update entity
             for attempt in range(self.config.retry_attempts):
+                token = self.auth_token
                 try:
+                    if exists is None:
+                        return self._upsert_entity(entity_id, data)
                     if exists:
                         return self._update_entity(entity_id, data)
                     else:
                         return self._create_entity(data)
-                except LoaderError:
-                    if attempt == self.config.retry_attempts - 1:
+                except LoaderError as e:
+                    if (
+                        attempt == self.config.retry_attempts - 1
+                        or not self._prepare_retry(e, token)
+                    ):
                         raise
-                    # Re-authenticate and retry
-                    self._authenticate()
 
             return False
 
@@ -217,7 +493,172 @@ class IvantiLoader(DataLoader[Dict[str, Any]]):
                 raise
             raise LoaderError(f"Load operation failed: {str(e)}") from e
 
+    def _bulk_load(self, batch: List[Dict[str, Any]]) -> Optional[List[bool]]:
+        """
+        Create or update a batch of entities in a single request.
+
+        The API answers with one result per entity, in request order, such
+        as {"results": [{"status": 201}, {"status": 400, "error": "..."}]}.
+
+        Args:
+            batch: Entity data to load
+
+        Returns:
+            Optional[List[bool]]: Load result of each entity, in order, or
+                None if the API has no bulk endpoint
+
+        Raises:
+            LoaderError: If the bulk request fails
+        """
+        try:
+            response = self._client.post(
+                f"/api/{self.config.entity_type}/_bulk",
+                content=_encode_json({"items": batch}),
+                headers=_JSON_HEADERS
+            )
+            if response.status_code in _BULK_UNSUPPORTED_CODES:
+                return None
+            response.raise_for_status()
+            item_results = response.json().get("results", [])
+
+        except Exception as e:
+            raise LoaderError(
+                f"Failed to bulk load {self.config.entity_type}: {str(e)}"
+            ) from e
+
+        # Entities missing from the response are counted as failed
+        results = []
+        for index in range(len(batch)):
+            item = item_results[index] if index < len(item_results) else {}
+            results.append(200 <= item.get("status", 0) < 300)
+        return results
+
+    def _load_individually(self, batch: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Load a batch of data record by record, up to max_concurrency
+        records at a time.
+
+        Args:
+            batch: Data to load
+
+        Returns:
+            List[bool]: Load result of each record, in order
+        """
+        existing = self._existing_ids(batch)
+        if existing is None:
+            known = [(data, None) for data in batch]
+        else:
+            known = [(data, data.get("id") in existing) for data in batch]
+
+        workers = min(self.config.max_concurrency, len(batch))
+        if workers <= 1:
+            return [self._try_load(data, exists) for data, exists in known]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self._try_load(*item), known))
+
+    def _existing_ids(self, batch: List[Dict[str, Any]]) -> Optional[Set[str]]:
+        """
+        Look up which records of a batch already exist, in one request.
+
+        Args:
+            batch: Data to load
+
+        Returns:
+            Optional[Set[str]]: IDs of existing entities, or None if upserts
+                are enabled or the lookup failed
+        """
+        if self.config.use_upsert:
+            return None
+
+        entity_ids = [data["id"] for data in batch if data.get("id")]
+        if not entity_ids:
+            return None
+
+        try:
+            self._ensure_authenticated()
+            return self._exists_many(entity_ids)
+        except LoaderError:
+            # Fall back to checking each record
+            return None
+
+    def _try_load(self, data: Dict[str, Any], exists: Optional[bool]) -> bool:
+        """
+        Load a single record, reporting failure instead of raising.
+
+        Args:
+            data: Data to load
+            exists: Whether the entity is known to exist
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            return self._load(data, exists)
+        except LoaderError:
+            return False
+
+    def load_many(self, batch: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Load a batch of data into Ivanti.
+
+        With use_bulk set, the batch is sent as a single bulk request and
+        each record gets the status the API reports for it. If the API has
+        no bulk endpoint, records are loaded one at a time from then on; if
+        the bulk request fails, only this batch is loaded one at a time.
+
+        Args:
+            batch: Data to load
+
+        Returns:
+            List[bool]: Load result of each record, in order
+        """
+        if not self._bulk_supported:
+            return self._load_individually(batch)
+
+        # Records without an id are rejected, as in load()
+        valid = [bool(data.get("id")) for data in batch]
+        items = [data for data, ok in zip(batch, valid) if ok]
+        if not items:
+            return valid
+
+        try:
+            self._ensure_authenticated()
+            for attempt in range(self.config.retry_attempts):
+                token = self.auth_token
+                try:
+                    item_results = self._bulk_load(items)
+                    break
+                except LoaderError as e:
+                    if (
+                        attempt == self.config.retry_attempts - 1
+                        or not self._prepare_retry(e, token)
+                    ):
+                        raise
+
+        except LoaderError:
+            return self._load_individually(batch)
+
+        if item_results is None:
+            self._bulk_supported = False
+            return self._load_individually(batch)
+
+        item_results = iter(item_results)
+        return [ok and next(item_results) for ok in valid]
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "IvantiLoader":
+        """Use the loader as a context manager that closes its client."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the HTTP client on exit."""
+        self.close()
+
     def __del__(self):
         """Cleanup resources."""
         if hasattr(self, '_client'):
-            self._client.close()
\ No newline at end of file
+            self.close()
\ No newline at end of file
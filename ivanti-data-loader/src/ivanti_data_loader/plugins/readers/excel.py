@@ -30,6 +30,10 @@ class ExcelReaderConfig(DataSourceConfig):
         default_factory=list,
         description="List of required column names"
     )
+    engine: str = Field(
+        default="calamine",
+        description="pandas.read_excel engine used to read the sheet"
+    )
 
 
 class ExcelRecord(BaseModel):
@@ -61,6 +65,21 @@ class ExcelReader(DataReader[ExcelRecord]):
         Returns:
             List[ExcelRecord]: List of records from Excel
 
+        Raises:
+            ReaderError: If reading fails
+        """
+        return self.records_from_dataframe(self.read_dataframe())
+
+    def read_dataframe(self) -> pd.DataFrame:
+        """
+        Read the valid rows of the Excel file into a DataFrame.
+
+        Missing values are None, and the index holds the spreadsheet row
+        number of each row.
+
+        Returns:
+            pd.DataFrame: Rows from Excel
+
         Raises:
             ReaderError: If reading fails
         """
@@ -70,7 +89,8 @@ class ExcelReader(DataReader[ExcelRecord]):
                 self.file_path,
                 sheet_name=self.config.sheet_name,
                 header=self.config.header_row,
-                skiprows=self.config.skip_rows
+                skiprows=self.config.skip_rows,
+                engine=self.config.engine
             )
 
             # Validate required columns
@@ -81,31 +101,44 @@ class ExcelReader(DataReader[ExcelRecord]):
                         f"Required columns missing: {', '.join(missing_columns)}"
                     )
 
-            # Convert to records
-            records = []
-            for index, row in df.iterrows():
-                # Convert row to dictionary, handling NaN values
-                data = {}
-                for column in df.columns:
-                    value = row[column]
-                    # Convert NaN/None to None for consistency
-                    data[column] = None if pd.isna(value) else value
-
-                record = ExcelRecord(
-                    row_number=index + self.config.header_row + self.config.skip_rows + 2,
-                    data=data
-                )
-                
-                if self.validate(record):
-                    records.append(record)
-
-            return records
+            # Convert NaN/None to None for consistency; object dtype keeps
+            # None from being cast back to NaN in numeric columns
+            mask = df.notna()
+            cleaned = df.astype(object).where(mask, None)
+
+            # Drop rows missing a required value in one vectorized pass,
+            # instead of validating each record
+            if self.config.required_columns:
+                valid = mask[self.config.required_columns].all(axis=1).to_numpy()
+                cleaned = cleaned[valid]
+
+            cleaned.index = (
+                cleaned.index + self.config.header_row + self.config.skip_rows + 2
+            )
+            return cleaned
 
         except Exception as e:
             if isinstance(e, ReaderError):
                 raise
             raise ReaderError(f"Failed to read Excel file: {str(e)}") from e
 
+    def records_from_dataframe(self, df: pd.DataFrame) -> List[ExcelRecord]:
+        """
+        Convert rows read by read_dataframe() to records.
+
+        Args:
+            df: Rows from Excel
+
+        Returns:
+            List[ExcelRecord]: List of records from Excel
+        """
+        # The fields are built right here, so the per-row model validation
+        # is skipped
+        return [
+            ExcelRecord.model_construct(row_number=row_number, data=data)
+            for row_number, data in zip(df.index, df.to_dict(orient="records"))
+        ]
+
     def validate(self, record: ExcelRecord) -> bool:
         """
         Validate Excel record.
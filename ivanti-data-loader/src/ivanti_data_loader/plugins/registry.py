@@ -1,5 +1,6 @@
 """Plugin registry for data loader components."""
-from typing import Dict, Type, TypeVar
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, TypeVar
 
 from ..core.base import DataReader, DataTransformer, DataLoader
 from ..core.exceptions import PluginError
@@ -83,9 +84,10 @@ class PluginRegistry:
         Raises:
             PluginError: If plugin not found
         """
-        if name not in cls._readers:
-            raise PluginError(f"Reader plugin '{name}' not found")
-        return cls._readers[name]
+        try:
+            return cls._readers[name]
+        except KeyError as e:
+            raise PluginError(f"Reader plugin '{name}' not found") from e
 
     @classmethod
     def get_transformer(cls, name: str) -> Type[DataTransformer]:
@@ -101,9 +103,10 @@ class PluginRegistry:
         Raises:
             PluginError: If plugin not found
         """
-        if name not in cls._transformers:
-            raise PluginError(f"Transformer plugin '{name}' not found")
-        return cls._transformers[name]
+        try:
+            return cls._transformers[name]
+        except KeyError as e:
+            raise PluginError(f"Transformer plugin '{name}' not found") from e
 
     @classmethod
     def get_loader(cls, name: str) -> Type[DataLoader]:
@@ -119,20 +122,22 @@ class PluginRegistry:
         Raises:
             PluginError: If plugin not found
         """
-        if name not in cls._loaders:
-            raise PluginError(f"Loader plugin '{name}' not found")
-        return cls._loaders[name]
+        try:
+            return cls._loaders[name]
+        except KeyError as e:
+            raise PluginError(f"Loader plugin '{name}' not found") from e
 
     @classmethod
-    def list_plugins(cls) -> Dict[str, Dict[str, Type[PluginTypes]]]:
+    def list_plugins(cls) -> Dict[str, Mapping[str, Type[PluginTypes]]]:
         """
         List all registered plugins.
 
         Returns:
-            Dict[str, Dict[str, Type[PluginTypes]]]: Dictionary of plugin types and their registered plugins
+            Dict[str, Mapping[str, Type[PluginTypes]]]: Read-only views of the
+                registered plugins, by plugin type
         """
         return {
-            "readers": cls._readers.copy(),
-            "transformers": cls._transformers.copy(),
-            "loaders": cls._loaders.copy()
+            "readers": MappingProxyType(cls._readers),
+            "transformers": MappingProxyType(cls._transformers),
+            "loaders": MappingProxyType(cls._loaders)
         }
\ No newline at end of file
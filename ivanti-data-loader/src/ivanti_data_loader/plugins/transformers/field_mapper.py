@@ -1,12 +1,19 @@
 """Field mapping transformer plugin."""
-from typing import Any, Callable, Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field
 
 from ...core.base import DataTransformer, MappingConfig
 from ...core.exceptions import TransformerError
 from ..registry import PluginRegistry
 
+# Strings to_bool() treats as true, after lowercasing
+_TRUE_STRINGS = frozenset(('true', 'yes', '1', 'on'))
+
 
 class FieldTransform:
     """Collection of field transformation functions."""
@@ -14,12 +21,21 @@ class FieldTransform:
     @staticmethod
     def to_string(value: Any) -> str:
         """Convert value to string."""
+        if type(value) is str:
+            return value
         return str(value) if value is not None else ""
 
     @staticmethod
     def to_int(value: Any) -> Optional[int]:
         """Convert value to integer."""
+        # Integers are kept exact; going through float would round the
+        # ones beyond 2**53, such as 64-bit IDs
+        value_type = type(value)
+        if value_type is int:
+            return value
         try:
+            if value_type is float or value_type is bool:
+                return int(value)
             return int(float(value)) if value is not None else None
         except (ValueError, TypeError):
             return None
@@ -27,6 +43,8 @@ class FieldTransform:
     @staticmethod
     def to_float(value: Any) -> Optional[float]:
         """Convert value to float."""
+        if type(value) is float:
+            return value
         try:
             return float(value) if value is not None else None
         except (ValueError, TypeError):
@@ -35,10 +53,21 @@ class FieldTransform:
     @staticmethod
     def to_bool(value: Any) -> Optional[bool]:
         """Convert value to boolean."""
+        # Exact type checks first; subclasses such as numpy.float64 take
+        # the isinstance path
+        value_type = type(value)
+        if value_type is bool:
+            return value
+        if value_type is str:
+            return value.lower() in _TRUE_STRINGS
+        if value_type is int or value_type is float:
+            return bool(value)
+        if value is None:
+            return None
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.lower() in ('true', 'yes', '1', 'on')
+            return value.lower() in _TRUE_STRINGS
         if isinstance(value, (int, float)):
             return bool(value)
         return None
@@ -46,16 +75,22 @@ class FieldTransform:
     @staticmethod
     def strip(value: Any) -> str:
         """Strip whitespace from string value."""
+        if type(value) is str:
+            return value.strip()
         return str(value).strip() if value is not None else ""
 
     @staticmethod
     def upper(value: Any) -> str:
         """Convert value to uppercase."""
+        if type(value) is str:
+            return value.upper()
         return str(value).upper() if value is not None else ""
 
     @staticmethod
     def lower(value: Any) -> str:
         """Convert value to lowercase."""
+        if type(value) is str:
+            return value.lower()
         return str(value).lower() if value is not None else ""
 
 
@@ -73,6 +108,192 @@ class FieldMapperConfig(BaseModel):
         default=False,
         description="Include fields not in mapping"
     )
+    string_cache_size: int = Field(
+        default=4096,
+        ge=0,
+        description=(
+            "Results cached per chained string transform, for repeated "
+            "values; 0 disables caching"
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _split_transform_spec(transform: str) -> Tuple[str, ...]:
+    """
+    Split a transform spec into transform names, once per process.
+
+    Args:
+        transform: Transform spec, e.g. "strip|upper"
+
+    Returns:
+        Tuple[str, ...]: Transform names, in order
+    """
+    return tuple(t.strip() for t in transform.split('|'))
+
+
+def _raiser(error: Exception) -> Callable[[Any], Any]:
+    """
+    Build a transform function that always raises the given error.
+
+    Args:
+        error: Error to raise
+
+    Returns:
+        Callable[[Any], Any]: Transform function
+    """
+    def raise_error(value: Any) -> Any:
+        raise error
+    return raise_error
+
+
+# String transforms, by the str method they apply once the value is a str
+_STRING_METHODS: Dict[Callable, Optional[Callable[[str], str]]] = {
+    FieldTransform.to_string: None,
+    FieldTransform.strip: str.strip,
+    FieldTransform.upper: str.upper,
+    FieldTransform.lower: str.lower,
+}
+
+
+def _fuse_string_chain(
+    chain: Tuple[Callable, ...],
+    cache_size: int = 0
+) -> Optional[Callable]:
+    """
+    Fuse a chain of built-in string transforms into a single function.
+
+    The fused function converts the value to str once, then applies the
+    str methods in order, e.g. "strip|upper" becomes str(v).strip().upper().
+    Results for str values are cached, since feeds repeat the same
+    statuses and categories; the cache is emptied when full. Short cached
+    results are interned, so equal results share a single object.
+
+    Args:
+        chain: Transform functions, in order
+        cache_size: Maximum number of cached results, 0 for no cache
+
+    Returns:
+        Optional[Callable]: The fused function, or None if the chain has a
+            transform other than the built-in string ones
+    """
+    if not all(func in _STRING_METHODS for func in chain):
+        return None
+
+    methods = tuple(
+        method
+        for method in (_STRING_METHODS[func] for func in chain)
+        if method is not None
+    )
+
+    def fused(value: Any) -> str:
+        if value is None:
+            return ""
+        if type(value) is not str:
+            value = str(value)
+        for method in methods:
+            value = method(value)
+        return value
+
+    if not cache_size:
+        return fused
+
+    cache: Dict[str, str] = {}
+
+    def cached(value: Any) -> str:
+        if type(value) is not str:
+            return fused(value)
+        result = cache.get(value)
+        if result is None:
+            if len(cache) >= cache_size:
+                cache.clear()
+            result = fused(value)
+            if len(result) <= _MAX_INTERNED_LENGTH:
+                result = sys.intern(result)
+            cache[value] = result
+        return result
+
+    return cached
+
+
+def _compose(chain: Tuple[Callable, ...], cache_size: int = 0) -> Callable:
+    """
+    Compose a chain of transform functions into a single function.
+
+    Args:
+        chain: Transform functions, in order
+        cache_size: Maximum number of results cached by fused string chains
+
+    Returns:
+        Callable: Function applying the whole chain
+    """
+    if len(chain) == 1:
+        return chain[0]
+
+    fused = _fuse_string_chain(chain, cache_size)
+    if fused is not None:
+        return fused
+
+    def composed(value: Any) -> Any:
+        for func in chain:
+            value = func(value)
+        return value
+
+    return composed
+
+
+# Longest cached string transform result that is interned
+_MAX_INTERNED_LENGTH = 64
+
+
+# Inferred types of object columns whose values convert with a numpy cast
+# exactly as they do with float()
+_NUMERIC_DTYPES = frozenset(("integer", "floating", "mixed-integer-float"))
+
+
+def _cast_numeric_column(
+    column: pd.Series,
+    func: Callable
+) -> Optional[pd.Series]:
+    """
+    Apply a lone float or int transform to a numeric column in one cast.
+
+    Args:
+        column: Column values, with no missing values
+        func: Transform function of the mapping
+
+    Returns:
+        Optional[pd.Series]: Transformed column, or None if the column must
+            be transformed value by value
+    """
+    if func is not FieldTransform.to_float and func is not FieldTransform.to_int:
+        return None
+
+    inferred = pd.api.types.infer_dtype(column, skipna=False)
+    if inferred not in _NUMERIC_DTYPES:
+        return None
+
+    if func is FieldTransform.to_int:
+        if inferred == "integer":
+            # to_int keeps integers as they are
+            return column
+        if inferred != "floating":
+            # Integers mixed with floats must not be rounded through float
+            return None
+
+    values = column.to_numpy(dtype=np.float64)
+    if func is FieldTransform.to_float:
+        return pd.Series(values, index=column.index)
+
+    # int(value) truncates floats, and fails on infinite ones
+    if not (np.isfinite(values).all() and (np.abs(values) < 2 ** 63).all()):
+        return None
+    return pd.Series(np.trunc(values).astype(np.int64), index=column.index)
+
+
+# Source field, target field, default value and transform function (None
+# if untransformed) of each mapping
+_FieldPlan = Tuple[Tuple[str, str, Any, Optional[Callable]], ...]
 
 
 @PluginRegistry.register_transformer("field_mapper")
@@ -89,6 +310,7 @@ class FieldMapper(DataTransformer[Dict[str, Any], Dict[str, Any]]):
         super().__init__(config.mappings)
         self.ignore_missing = config.ignore_missing
         self.include_unmapped = config.include_unmapped
+        self.string_cache_size = config.string_cache_size
         self._transform_functions: Dict[str, Callable] = {
             'string': FieldTransform.to_string,
             'int': FieldTransform.to_int,
@@ -98,39 +320,65 @@ class FieldMapper(DataTransformer[Dict[str, Any], Dict[str, Any]]):
             'upper': FieldTransform.upper,
             'lower': FieldTransform.lower
         }
+        # Resolved transforms: transform spec -> function applying it
+        self._resolved_transforms: Dict[str, Callable] = {}
+        self._mapped_sources = frozenset(m.source_field for m in self.config)
+        # Mappings compiled once, and again when a transform is registered
+        self._field_plan = self._compile_fields()
 
-    def _apply_transform(
-        self,
-        value: Any,
-        transform: Optional[str]
-    ) -> Any:
+    def _resolve_transform(self, transform: str) -> Callable:
         """
-        Apply transformation to value.
+        Resolve a transform spec to a single function, once per spec.
 
         Args:
-            value: Value to transform
-            transform: Name of transform to apply
+            transform: Transform spec, e.g. "strip|upper"
 
         Returns:
-            Any: Transformed value
+            Callable: Function applying the transforms, in order
 
         Raises:
             TransformerError: If transform not found
         """
-        if not transform:
-            return value
-
-        # Handle multiple transforms (e.g., "strip|upper")
-        transforms = transform.split('|')
-        result = value
+        func = self._resolved_transforms.get(transform)
+        if func is None:
+            # Handle multiple transforms (e.g., "strip|upper")
+            functions = []
+            for t in _split_transform_spec(transform):
+                if t not in self._transform_functions:
+                    raise TransformerError(f"Transform not found: {t}")
+                functions.append(self._transform_functions[t])
+            func = self._resolved_transforms[transform] = _compose(
+                tuple(functions),
+                self.string_cache_size
+            )
+        return func
+
+    def _compile_fields(self) -> _FieldPlan:
+        """
+        Compile the field mappings into a flat plan applied by transform().
 
-        for t in transforms:
-            t = t.strip()
-            if t not in self._transform_functions:
-                raise TransformerError(f"Transform not found: {t}")
-            result = self._transform_functions[t](result)
+        Unknown transforms compile to a function raising the lookup error,
+        so they only fail records that reach them, as before compilation.
 
-        return result
+        Returns:
+            _FieldPlan: Source field, target field, default value and
+                transform function of each mapping
+        """
+        plan = []
+        for mapping in self.config:
+            func: Optional[Callable] = None
+            if mapping.transform:
+                try:
+                    func = self._resolve_transform(mapping.transform)
+                except TransformerError as e:
+                    func = _raiser(e)
+            plan.append((
+                mapping.source_field,
+                mapping.target_field,
+                mapping.default_value,
+                func
+            ))
+        return tuple(plan)
 
     def transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -145,51 +393,115 @@ class FieldMapper(DataTransformer[Dict[str, Any], Dict[str, Any]]):
         Raises:
             TransformerError: If transformation fails
         """
+        # A single handler covers the whole record; source_field tells
+        # which mapping was being applied when an error occurred
+        source_field = None
+        missing_field = None
         try:
             result = {}
 
             # Apply mappings
-            for mapping in self.config:
-                source_value = data.get(mapping.source_field)
+            for source_field, target_field, default_value, func in (
+                self._field_plan
+            ):
+                value = data.get(source_field)
 
                 # Handle missing source fields
-                if source_value is None:
+                if value is None:
                     if self.ignore_missing:
                         continue
-                    if mapping.default_value is not None:
-                        source_value = mapping.default_value
-                    else:
-                        raise TransformerError(
-                            f"Missing required field: {mapping.source_field}"
-                        )
+                    if default_value is None:
+                        missing_field = source_field
+                        break
+                    value = default_value
 
                 # Apply transformation
-                try:
-                    transformed_value = self._apply_transform(
-                        source_value,
-                        mapping.transform
-                    )
-                    result[mapping.target_field] = transformed_value
-                except Exception as e:
-                    raise TransformerError(
-                        f"Transform failed for field {mapping.source_field}: {str(e)}"
-                    ) from e
+                if func is not None:
+                    value = func(value)
+                result[target_field] = value
 
             # Include unmapped fields if configured
-            if self.include_unmapped:
-                mapped_sources = {m.source_field for m in self.config}
+            source_field = None
+            if self.include_unmapped and missing_field is None:
                 unmapped = {
                     k: v for k, v in data.items()
-                    if k not in mapped_sources
+                    if k not in self._mapped_sources
                 }
                 result.update(unmapped)
 
-            return result
-
         except Exception as e:
-            if isinstance(e, TransformerError):
-                raise
-            raise TransformerError(f"Transformation failed: {str(e)}") from e
+            if source_field is None:
+                raise TransformerError(
+                    f"Transformation failed: {str(e)}"
+                ) from e
+            raise TransformerError(
+                f"Transform failed for field {source_field}: {str(e)}"
+            ) from e
+
+        if missing_field is not None:
+            raise TransformerError(f"Missing required field: {missing_field}")
+        return result
+
+    def transform_dataframe(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Transform a whole DataFrame using field mappings.
+
+        Columns are renamed and default values filled per column. Frames
+        whose rows would not all transform identically to transform() are
+        left to the per-record path.
+
+        Args:
+            df: Source rows, with None for missing values
+
+        Returns:
+            Optional[pd.DataFrame]: Transformed rows with the same index, or
+                None if the frame needs per-record transformation
+        """
+        if self.ignore_missing:
+            # Missing fields are dropped per record, not per column
+            return None
+
+        try:
+            columns = {}
+            for source_field, target_field, default_value, func in (
+                self._field_plan
+            ):
+                if source_field in df.columns:
+                    column = df[source_field]
+                else:
+                    column = pd.Series(None, index=df.index, dtype=object)
+
+                missing = column.isna()
+                if missing.any():
+                    if default_value is None:
+                        # Rows missing a required field fail individually
+                        return None
+                    column = column.where(~missing, default_value)
+
+                if func is not None:
+                    cast = _cast_numeric_column(column, func)
+                    if cast is not None:
+                        columns[target_field] = cast
+                        continue
+                    # Object dtype keeps None results from becoming NaN
+                    column = pd.Series(
+                        [func(value) for value in column],
+                        index=df.index,
+                        dtype=object
+                    )
+                columns[target_field] = column
+
+            # Include unmapped fields if configured
+            if self.include_unmapped:
+                for name in df.columns:
+                    if name not in self._mapped_sources:
+                        columns[name] = df[name]
+
+            return pd.DataFrame(columns, index=df.index)
+
+        except Exception:
+            # Let transform() report the failing records
+            return None
 
     def register_transform(
         self,
@@ -208,4 +520,6 @@ class FieldMapper(DataTransformer[Dict[str, Any], Dict[str, Any]]):
         """
         if name in self._transform_functions:
             raise TransformerError(f"Transform already exists: {name}")
-        self._transform_functions[name] = func
\ No newline at end of file
+        self._transform_functions[name] = func
+        # Recompile mappings whose transform could not be resolved before
+        self._field_plan = self._compile_fields()
\ No newline at end of file